@@ -14,20 +14,89 @@ Parses job postings from HTML files or URLs and extracts structured data:
 Outputs structured JSON for use with AI resume tailoring.
 """
 
+import gzip
 import hashlib
 import json
+import os
 import re
+import zlib
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from bs4 import BeautifulSoup, Tag
+if TYPE_CHECKING:
+    import requests
+    from bs4 import BeautifulSoup, Tag
+
+# requests (optional, URL fetching only) and bs4 are imported on first use so that
+# importing this module does not pay for them
+_requests = None
+_BeautifulSoup = None
+
+
+def _get_requests() -> Any:
+    """
+    Import requests on first use.
+
+    Returns:
+        The requests module
+
+    Raises:
+        ImportError: If requests is not installed
+    """
+    global _requests
+
+    if _requests is None:
+        import requests
+
+        _requests = requests
+    return _requests
+
+
+def _make_soup(html: str) -> "BeautifulSoup":
+    """
+    Parse HTML with BeautifulSoup, importing bs4 on first use.
+
+    Args:
+        html: Raw HTML content
+
+    Returns:
+        BeautifulSoup object using the lxml parser
+    """
+    global _BeautifulSoup
+
+    if _BeautifulSoup is None:
+        from bs4 import BeautifulSoup
 
-# Optional import for URL fetching
+        _BeautifulSoup = BeautifulSoup
+    return _BeautifulSoup(html, "lxml")
+
+
+# Optional fast JSON backend for the job cache
 try:
-    import requests
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
 except ImportError:
-    requests = None
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+    _loads = json.loads
+
+# Section headers in job descriptions. The trailing colon/newline is a lookahead so
+# adjacent headers are not swallowed by the previous match during finditer.
+_SECTION_HEADER_RE = re.compile(
+    r"(?:^|\n)\s*(?:"
+    r"(?P<req>requirements?|qualifications?|what we(?:'re)? looking for|what you(?:'ll)? bring)"
+    r"|(?P<resp>responsibilities?|duties?|what you(?:'ll)? do|your impact|key responsibilities)"
+    r"|(?P<end>benefits|compensation|perks|about|company|team)"
+    r")(?=\s*:?\s*\n)",
+    re.IGNORECASE,
+)
 
 
 @dataclass
@@ -53,6 +122,8 @@ class JobDetails:
 
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
+        if indent == 2:
+            return _dumps(self.to_dict()).decode("utf-8")
         return json.dumps(self.to_dict(), indent=indent, default=str)
 
     @classmethod
@@ -172,6 +243,35 @@ class JobParser:
         "remote available",
     ]
 
+    # On-site only indicators
+    ONSITE_KEYWORDS = ["on-site", "onsite", "in-office", "in person", "at our office"]
+
+    # Substrings that every remote/hybrid/on-site keyword contains. Texts with none of
+    # them cannot match, so the keyword scan is skipped for them.
+    _REMOTE_QUICK_CHECK = (
+        "remote",
+        "hybrid",
+        "onsite",
+        "on-site",
+        "office",
+        "home",
+        "wfh",
+        "telecom",
+        "virtual",
+        "distributed",
+        "flexible",
+        "in person",
+    )
+
+    # Single alternation over all remote-status keywords, matched against lowercased text
+    _REMOTE_STATUS_RE = re.compile(
+        "(?P<remote>{})|(?P<hybrid>{})|(?P<onsite>{})".format(
+            "|".join(map(re.escape, REMOTE_KEYWORDS)),
+            "|".join(map(re.escape, HYBRID_KEYWORDS)),
+            "|".join(map(re.escape, ONSITE_KEYWORDS)),
+        )
+    )
+
     def __init__(self, cache_dir: Optional[Path] = None):
         """
         Initialize job parser.
@@ -182,6 +282,7 @@ class JobParser:
         """
         self.cache_dir = cache_dir or Path.home() / ".resume-cli" / "cache" / "jobs"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._session = None
 
     def parse_from_file(self, file_path: Path, url: Optional[str] = None) -> JobDetails:
         """
@@ -200,7 +301,7 @@ class JobParser:
             job_details.url = url
         return job_details
 
-    def parse_from_url(self, url: str) -> JobDetails:
+    def parse_from_url(self, url: str, refresh: bool = False) -> JobDetails:
         """
         Parse job posting from URL.
 
@@ -209,6 +310,9 @@ class JobParser:
 
         Args:
             url: URL to job posting
+            refresh: Re-fetch even if cached. A conditional request is sent
+                     using the stored ETag/Last-Modified, so an unchanged
+                     posting reuses the cached data without a body transfer.
 
         Returns:
             JobDetails with extracted information
@@ -216,14 +320,28 @@ class JobParser:
         # Check cache first
         cache_key = self._get_cache_key(url)
         cached = self._get_from_cache(cache_key)
-        if cached:
+        if cached and not refresh:
             return cached
 
-        # Fetch and parse
         try:
+            requests = _get_requests()
+        except ImportError:
+            raise NotImplementedError(
+                "URL fetching requires 'requests' library. Install with: pip install requests"
+            )
 
+        # Fetch and parse
+        try:
             headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-            response = requests.get(url, headers=headers, timeout=30)
+            validators = self._get_cache_validators(cache_key) if cached else {}
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+            response = self._get_session().get(url, headers=headers, timeout=30)
+            if cached and response.status_code == 304:
+                return cached
             response.raise_for_status()
 
             job_details = self._parse_html(response.text)
@@ -231,16 +349,67 @@ class JobParser:
 
             # Save to cache
             self._save_to_cache(cache_key, job_details)
+            self._save_cache_validators(cache_key, response.headers)
 
             return job_details
 
-        except ImportError:
-            raise NotImplementedError(
-                "URL fetching requires 'requests' library. Install with: pip install requests"
-            )
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to fetch URL: {e}")
 
+    def _get_session(self) -> "requests.Session":
+        """
+        Get the pooled HTTP session, creating it on first use.
+
+        Returns:
+            requests.Session with keep-alive connection pooling
+
+        Raises:
+            ImportError: If requests is not installed
+        """
+        if self._session is None:
+            requests = _get_requests()
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def _get_cache_validators(self, cache_key: str) -> Dict[str, str]:
+        """
+        Get stored HTTP validators (ETag/Last-Modified) for a cached URL.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Dictionary with optional 'etag' and 'last_modified' entries
+        """
+        try:
+            return _loads((self.cache_dir / f"{cache_key}.meta").read_bytes())
+        except (ValueError, IOError):
+            return {}
+
+    def _save_cache_validators(self, cache_key: str, response_headers: Any) -> None:
+        """
+        Store HTTP validators from a response next to the cache entry.
+
+        Args:
+            cache_key: Cache key
+            response_headers: Response headers mapping
+        """
+        validators = {
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+        }
+        meta_file = self.cache_dir / f"{cache_key}.meta"
+        if any(validators.values()):
+            meta_file.write_bytes(_dumps(validators))
+        else:
+            meta_file.unlink(missing_ok=True)
+
     def _parse_html(self, html: str) -> JobDetails:
         """
         Parse HTML content and detect source automatically.
@@ -291,7 +460,7 @@ class JobParser:
         Returns:
             JobDetails with extracted information
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = _make_soup(html)
 
         # Extract company
         company = self._extract_by_selectors(soup, self.LINKEDIN_SELECTORS["company"])
@@ -326,7 +495,7 @@ class JobParser:
         requirements, responsibilities = self._extract_sections_from_description(description)
 
         # Detect remote status
-        remote = self._detect_remote_status(html + " " + (description or ""))
+        remote = self._detect_remote_status(html, description)
 
         # Extract job type and experience level
         job_type = self._extract_job_type(html)
@@ -355,7 +524,7 @@ class JobParser:
         Returns:
             JobDetails with extracted information
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = _make_soup(html)
 
         # Extract company
         company = self._extract_by_selectors(soup, self.INDEED_SELECTORS["company"])
@@ -387,7 +556,7 @@ class JobParser:
         requirements, responsibilities = self._extract_sections_from_description(description)
 
         # Detect remote status
-        remote = self._detect_remote_status(html + " " + (description or ""))
+        remote = self._detect_remote_status(html, description)
 
         # Extract job type and experience level
         job_type = self._extract_job_type(html)
@@ -416,7 +585,7 @@ class JobParser:
         Returns:
             JobDetails with extracted information
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = _make_soup(html)
 
         # Try to extract company from various patterns
         company = self._extract_text_by_pattern(
@@ -493,7 +662,7 @@ class JobParser:
             experience_level=experience_level,
         )
 
-    def _extract_by_selectors(self, soup: BeautifulSoup, selectors: List[str]) -> Optional[str]:
+    def _extract_by_selectors(self, soup: "BeautifulSoup", selectors: List[str]) -> Optional[str]:
         """
         Extract text using multiple CSS selectors.
 
@@ -512,7 +681,7 @@ class JobParser:
                     return text
         return None
 
-    def _find_by_selectors(self, soup: BeautifulSoup, selectors: List[str]) -> Optional[Tag]:
+    def _find_by_selectors(self, soup: "BeautifulSoup", selectors: List[str]) -> Optional["Tag"]:
         """
         Find element using multiple CSS selectors.
 
@@ -592,17 +761,27 @@ class JobParser:
         if not description:
             return requirements, responsibilities
 
-        # Find section boundaries using regex
-        # Match section headers with optional colon, at start of line or after newline
-        req_pattern = r"(?:^|\n)\s*(requirements?|qualifications?|what we(?:'re)? looking for|what you(?:'ll)? bring)\s*:?\s*\n"
-        resp_pattern = r"(?:^|\n)\s*(responsibilities?|duties?|what you(?:'ll)? do|your impact|key responsibilities)\s*:?\s*\n"
-
-        # Find positions of section headers
-        req_match = re.search(req_pattern, description, re.IGNORECASE)
-        resp_match = re.search(resp_pattern, description, re.IGNORECASE)
-
-        req_start = req_match.start() if req_match else -1
-        resp_start = resp_match.start() if resp_match else -1
+        # Locate every section header in one pass and remember where each kind starts
+        req_start = resp_start = -1
+        # Responsibilities end at the next end-of-list header (benefits, about, ...),
+        # otherwise at the next plain requirements/qualifications header
+        end_after_resp = req_after_resp = -1
+        for match in _SECTION_HEADER_RE.finditer(description):
+            kind = match.lastgroup
+            if kind == "resp":
+                if resp_start < 0:
+                    resp_start = match.start()
+            elif kind == "req":
+                if req_start < 0:
+                    req_start = match.start()
+                if (
+                    resp_start >= 0
+                    and req_after_resp < 0
+                    and match.group("req").lower().rstrip("s") in ("requirement", "qualification")
+                ):
+                    req_after_resp = match.start()
+            elif resp_start >= 0 and end_after_resp < 0:
+                end_after_resp = match.start()
 
         # Extract requirements section
         if req_start >= 0:
@@ -617,17 +796,12 @@ class JobParser:
 
         # Extract responsibilities section
         if resp_start >= 0:
-            # Find end of responsibilities section (look for next section or end)
-            next_section_patterns = [
-                r"(?:^|\n)\s*(benefits|compensation|perks|about|company|team)\s*:?\s*\n",
-                r"(?:^|\n)\s*(requirements?|qualifications?)\s*:?\s*\n",
-            ]
-            resp_end = len(description)
-            for pattern in next_section_patterns:
-                next_match = re.search(pattern, description[resp_start:], re.IGNORECASE)
-                if next_match:
-                    resp_end = resp_start + next_match.start()
-                    break
+            if end_after_resp >= 0:
+                resp_end = end_after_resp
+            elif req_after_resp >= 0:
+                resp_end = req_after_resp
+            else:
+                resp_end = len(description)
 
             resp_section = description[resp_start:resp_end]
             responsibilities = self._extract_items_from_text(resp_section)
@@ -711,7 +885,7 @@ class JobParser:
 
         return items[:15]
 
-    def _extract_list_items(self, element: Tag) -> List[str]:
+    def _extract_list_items(self, element: "Tag") -> List[str]:
         """
         Extract list items from a BeautifulSoup element.
 
@@ -745,7 +919,7 @@ class JobParser:
         Returns:
             List of extracted items
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = _make_soup(html)
 
         # Find element containing the keyword
         for elem in soup.find_all(string=re.compile(keyword, re.IGNORECASE)):
@@ -765,35 +939,35 @@ class JobParser:
 
         return []
 
-    def _detect_remote_status(self, text: str) -> Optional[bool]:
+    def _detect_remote_status(self, *texts: Optional[str]) -> Optional[bool]:
         """
         Detect if position is remote.
 
+        Each text is scanned separately, so callers can pass the page HTML and
+        the extracted description without concatenating them first.
+
         Args:
-            text: Text to analyze
+            *texts: Texts to analyze (empty or None pieces are skipped)
 
         Returns:
             True if remote, False if not remote, None if unclear
         """
-        text_lower = text.lower()
-
-        # Check for remote keywords
-        for keyword in self.REMOTE_KEYWORDS:
-            if keyword in text_lower:
-                return True
-
-        # Check for hybrid keywords
-        for keyword in self.HYBRID_KEYWORDS:
-            if keyword in text_lower:
-                return True  # Consider hybrid as remote-friendly
-
-        # Check for on-site only indicators
-        onsite_keywords = ["on-site", "onsite", "in-office", "in person", "at our office"]
-        for keyword in onsite_keywords:
-            if keyword in text_lower and "remote" not in text_lower:
-                return False
-
-        return None
+        onsite = False
+        for text in texts:
+            if not text:
+                continue
+            text_lower = text.lower()
+            if not any(quick in text_lower for quick in self._REMOTE_QUICK_CHECK):
+                continue
+            for match in self._REMOTE_STATUS_RE.finditer(text_lower):
+                if match.lastgroup == "onsite":
+                    onsite = True
+                else:
+                    # Remote, or hybrid which is considered remote-friendly
+                    return True
+
+        # On-site only when no remote or hybrid keyword appeared anywhere
+        return False if onsite else None
 
     def _extract_job_type(self, html: str) -> Optional[str]:
         """
@@ -856,43 +1030,55 @@ class JobParser:
         """
         Get cached job details.
 
+        Compressed entries are preferred; legacy uncompressed ``.json``
+        entries are still read so existing caches keep working.
+
         Args:
             cache_key: Cache key
 
         Returns:
             Cached JobDetails or None
         """
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        if cache_file.exists():
+        try:
             try:
-                data = json.loads(cache_file.read_text(encoding="utf-8"))
-                return JobDetails.from_dict(data)
-            except (json.JSONDecodeError, IOError):
-                return None
-        return None
+                raw = (self.cache_dir / f"{cache_key}.json.gz").read_bytes()
+                data = _loads(gzip.decompress(raw))
+            except FileNotFoundError:
+                data = _loads((self.cache_dir / f"{cache_key}.json").read_bytes())
+            return JobDetails.from_dict(data)
+        except (ValueError, IOError, EOFError, zlib.error):
+            return None
 
     def _save_to_cache(self, cache_key: str, job_details: JobDetails) -> None:
         """
-        Save job details to cache.
+        Save job details to cache as gzip-compressed JSON.
 
         Args:
             cache_key: Cache key
             job_details: JobDetails to cache
         """
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        cache_file.write_text(job_details.to_json(), encoding="utf-8")
+        cache_file = self.cache_dir / f"{cache_key}.json.gz"
+        cache_file.write_bytes(gzip.compress(_dumps(job_details.to_dict()), compresslevel=1))
 
     def clear_cache(self) -> int:
         """
         Clear all cached job postings.
 
+        Cache validator (``.meta``) files are removed too but not counted.
+
         Returns:
-            Number of files cleared
+            Number of cached jobs cleared
         """
         count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
-            count += 1
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith((".json", ".json.gz")):
+                    os.unlink(entry.path)
+                    count += 1
+                elif entry.name.endswith(".meta"):
+                    os.unlink(entry.path)
         return count
 
 
@@ -1,25 +1,368 @@
 """LinkedIn integration for importing/exporting profile data."""
 
+import codecs
 import csv
+import hashlib
 import json
+import logging
+import os
 import re
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..utils.yaml_parser import ResumeYAML
+
+logger = logging.getLogger(__name__)
+
+# Buffer size for reading export files; exports saved on Windows often start with a
+# UTF-8 BOM, so text is decoded as utf-8-sig to keep it out of the first key/column
+_READ_BUFFER_SIZE = 1 << 20
+
+# Optional streaming JSON parser for large LinkedIn exports
+try:
+    import ijson
+
+    _IJSON_ERRORS = ijson.JSONError
+except ImportError:
+    ijson = None
+    _IJSON_ERRORS = json.JSONDecodeError
+
+# Exports below this size are parsed in one go, which is several times faster than
+# streaming; larger ones are streamed with ijson (when installed) to bound memory
+_STREAM_JSON_MIN_BYTES = 64 << 20
+
+# Optional fast JSON backend for export parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Skill categorization keywords (literal strings, matched as whole words)
+_LANGUAGE_KEYWORDS = [
+    "python",
+    "javascript",
+    "java",
+    "go",
+    "rust",
+    "c++",
+    "c#",
+    "ruby",
+    "php",
+    "swift",
+    "kotlin",
+    "scala",
+    "haskell",
+    "typescript",
+    "sql",
+]
+
+_FRAMEWORK_KEYWORDS = [
+    "django",
+    "flask",
+    "fastapi",
+    "spring",
+    "react",
+    "angular",
+    "vue",
+    "express",
+    "rails",
+    "laravel",
+    "next.js",
+    "nuxt",
+    "tensorflow",
+    "pytorch",
+    "keras",
+    "pandas",
+    "numpy",
+    "scikit",
+    "langchain",
+]
+
+_CLOUD_KEYWORDS = [
+    "aws",
+    "azure",
+    "gcp",
+    "google cloud",
+    "amazon web services",
+    "heroku",
+    "vercel",
+    "netlify",
+    "digitalocean",
+    "linode",
+]
+
+_DATABASE_KEYWORDS = [
+    "postgres",
+    "postgresql",
+    "mysql",
+    "mongodb",
+    "redis",
+    "sqlite",
+    "oracle",
+    "sql server",
+    "cassandra",
+    "elasticsearch",
+    "dynamodb",
+]
+
+_TOOL_KEYWORDS = [
+    "docker",
+    "kubernetes",
+    "git",
+    "github",
+    "gitlab",
+    "jenkins",
+    "circleci",
+    "terraform",
+    "ansible",
+    "nagios",
+    "grafana",
+    "prometheus",
+]
+
+# Categories in priority order; a skill goes to the first category that matches
+_SKILL_CATEGORY_KEYWORDS = [
+    (_LANGUAGE_KEYWORDS, "languages"),
+    (_FRAMEWORK_KEYWORDS, "frameworks"),
+    (_CLOUD_KEYWORDS, "cloud_platforms"),
+    (_DATABASE_KEYWORDS, "databases"),
+    (_TOOL_KEYWORDS, "tools"),
+]
+
+
+def _keyword_trie_pattern(keywords: List[str]) -> str:
+    """
+    Build a regex alternation with shared prefixes factored out.
+
+    The alternation matches exactly the given keywords, but is shaped like a trie
+    (e.g. ``java(?:script)?``) so the regex engine tests each prefix once per position
+    instead of trying every keyword in turn.
+
+    Args:
+        keywords: Literal keywords
+
+    Returns:
+        Regex fragment matching any of the keywords
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+
+    return emit(trie)
+
+
+# One precompiled whole-word, trie-shaped alternation per category. Keywords are lower
+# case and skills are lower-cased before matching, which is cheaper than IGNORECASE
+_SKILL_CATEGORY_PATTERNS = [
+    (re.compile(r"\b(?:" + _keyword_trie_pattern(keywords) + r")\b"), category)
+    for keywords, category in _SKILL_CATEGORY_KEYWORDS
+]
+
+
+# Common LinkedIn date formats, keyed by the shape of string each one can parse:
+# full month names are longer than three letters and abbreviations are not ("May"
+# is both), and slash formats differ in their number of slashes
+_DATE_FORMATS_ALPHA = {True: ("%B %Y",), False: ("%b %Y",)}
+_DATE_FORMATS_SLASH = {1: ("%m/%Y",), 2: ("%m/%d/%Y",)}
+# Month abbreviations for "Mon YYYY" export dates, as strftime's %b gives them
+_MONTH_ABBREVIATIONS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+# Numeric formats keyed by their number of dashes; no other numeric format can match
+_DATE_FORMATS_NUMERIC = {2: ("%Y-%m-%d",), 1: ("%Y-%m",), 0: ("%Y",)}
+
+# Four-digit year fallback for free-form dates
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[str]:
+    """
+    Parse a non-empty LinkedIn date string to YYYY-MM format.
+
+    Only the format that can match the string's shape (month name length, slash
+    count, or dash count) is attempted, and results are memoized since exports
+    repeat the same dates across positions, education and certifications.
+
+    Args:
+        date_str: Date string from LinkedIn (various formats)
+
+    Returns:
+        Date in YYYY-MM format or None
+    """
+    # ISO dates (YYYY-MM-DD / YYYY-MM) are validated by the C-level date.fromisoformat
+    # rather than the pure-Python strptime machinery; years below 1000 are left to
+    # strptime, whose %Y output is not zero-padded
+    if (
+        len(date_str) in (7, 10)
+        and date_str.isascii()
+        and date_str[0] != "0"
+        and date_str[:4].isdigit()
+        and date_str[4] == "-"
+        and date_str[5:7].isdigit()
+        and (len(date_str) == 7 or (date_str[7] == "-" and date_str[8:].isdigit()))
+    ):
+        try:
+            date.fromisoformat(date_str if len(date_str) == 10 else date_str + "-01")
+            return date_str[:7]
+        except ValueError:
+            pass
+
+    if any(c.isalpha() for c in date_str):
+        formats = _DATE_FORMATS_ALPHA[len(date_str.split()[0]) > 3]
+    elif "/" in date_str:
+        formats = _DATE_FORMATS_SLASH.get(date_str.count("/"), ())
+    elif len(date_str) == 4 and date_str.isascii() and date_str.isdigit() and date_str[0] != "0":
+        # Bare year, the usual education date
+        return f"{date_str}-01"
+    else:
+        formats = _DATE_FORMATS_NUMERIC.get(date_str.count("-"), ())
+
+    for fmt in formats:
+        try:
+            dt = datetime.strptime(date_str, fmt)
+            return dt.strftime("%Y-%m")
+        except ValueError:
+            continue
+
+    # Try extracting year from string
+    year_match = _YEAR_RE.search(date_str)
+    if year_match:
+        return f"{year_match.group()}-01"
+
+    return None
+
+
+def _format_month_year(value: str) -> str:
+    """
+    Format a YYYY-MM date as "Mon YYYY" (e.g. "Jan 2020").
+
+    Well-formed values are converted with a month-name table; anything else goes
+    through strptime/strftime, and is returned unchanged if that fails too.
+
+    Args:
+        value: Date string, normally YYYY-MM
+
+    Returns:
+        Formatted date, or the input if it cannot be parsed
+    """
+    if (
+        len(value) == 7
+        and value.isascii()
+        and value[4] == "-"
+        and value[0] != "0"
+        and value[:4].isdigit()
+        and value[5:].isdigit()
+        and "01" <= value[5:] <= "12"
+    ):
+        return f"{_MONTH_ABBREVIATIONS[int(value[5:]) - 1]} {value[:4]}"
+
+    try:
+        return datetime.strptime(value, "%Y-%m").strftime("%b %Y")
+    except ValueError:
+        return value
 
 
 class LinkedInSync:
     """Sync LinkedIn profile data to/from resume.yaml."""
 
-    def __init__(self, config):
+    # Key aliases used by the different LinkedIn export formats (JSON, single CSV,
+    # folder CSVs), in lookup priority order
+    _SECTION_ALIASES = {
+        "experience": ("experience", "Experience", "positions", "Positions"),
+        "education": ("education", "Education"),
+        "skills": ("skills", "Skills"),
+        "certifications": ("certifications", "Certifications"),
+    }
+
+    _PROFILE_ALIASES = {
+        "first_name": ("firstName", "first_name", "FirstName", "First Name"),
+        "last_name": ("lastName", "last_name", "LastName", "Last Name"),
+        "full_name": ("fullName", "full_name"),
+        "email": ("email", "Email", "emailAddress"),
+        "phone": ("phone", "Phone", "phoneNumber"),
+        "headline": ("headline", "Headline"),
+        "location": ("location", "Location", "geoLocation", "Geo Location"),
+        "websites": ("websites", "Websites"),
+        "industry": ("industry", "Industry"),
+        "summary": ("summary", "Summary", "headline", "Headline"),
+    }
+
+    # contact.urls keys for the first three Websites entries
+    _URL_KEYS = ("website", "website_2", "website_3")
+
+    _SKILL_ALIASES = {
+        "name": ("name", "Name", "skillName"),
+    }
+
+    # CSV format: "Company Name", "Title", "Description", "Location", "Started On", "Finished On"
+    _EXPERIENCE_ALIASES = {
+        "company": ("company", "CompanyName", "companyName", "Company Name"),
+        "title": ("title", "Title", "jobTitle", "Job Title"),
+        "start_date": ("startDate", "start_date", "Started On"),
+        "end_date": ("endDate", "end_date", "Finished On"),
+        "location": ("location", "Location", "companyLocation", "Company Location"),
+        "description": ("description", "Description"),
+    }
+
+    # CSV format: "School Name", "Start Date", "End Date", "Notes", "Degree Name", "Activities"
+    _EDUCATION_ALIASES = {
+        "institution": ("school", "School", "schoolName", "institution", "School Name"),
+        "degree": ("degree", "Degree", "degreeName", "Degree Name"),
+        "end_date": ("endDate", "end_date", "graduationYear", "End Date"),
+        "location": ("schoolLocation", "location", "Location"),
+        "field": ("fieldOfStudy", "field_of_study", "field", "Field of Study"),
+    }
+
+    # CSV format: "Name", "Url", "Authority", "Started On", "Finished On", "License Number"
+    _CERTIFICATION_ALIASES = {
+        "name": ("name", "Name", "certificationName", "Certification Name"),
+        "authority": ("authority", "Authority", "issuingOrganization", "Issuer"),
+        "date": ("startDate", "start_date", "issueDate", "Started On", "Finished On"),
+        "url": ("url", "Url", "URL"),
+    }
+
+    # Bump when the import mapping changes so cached results from older versions are ignored
+    _IMPORT_CACHE_VERSION = "1"
+
+    def __init__(self, config, cache_dir: Optional[Path] = None):
         """
         Initialize LinkedIn sync.
 
         Args:
             config: Config object
+            cache_dir: Directory for caching import results.
+                      Defaults to ~/.resume-cli/cache/linkedin
         """
         self.config = config
         self.linkedin_config = config.get("linkedin", {})
+        self.cache_dir = cache_dir or Path.home() / ".resume-cli" / "cache" / "linkedin"
 
         # CSV field mapping from LinkedIn CSV export column names to internal keys
         self._csv_field_mapping = {
@@ -62,7 +405,7 @@ class LinkedInSync:
             "3. Use the downloaded JSON file with --data-file"
         )
 
-    def import_from_json(self, json_path: Path) -> Dict[str, Any]:
+    def import_from_json(self, json_path: Path, use_cache: Optional[bool] = None) -> Dict[str, Any]:
         """
         Import LinkedIn profile data from JSON, CSV, or folder export.
 
@@ -72,8 +415,14 @@ class LinkedInSync:
         - Single CSV file (basic Profile.csv)
         - Folder with multiple CSV files (full LinkedIn data export)
 
+        Results can be cached per export and reused until the export changes. The
+        cache holds personal profile data, so it is off unless enabled with
+        ``linkedin.cache_imports`` in the config or ``use_cache=True``.
+
         Args:
             json_path: Path to LinkedIn export file (JSON, CSV, or folder)
+            use_cache: Whether to reuse and store cached import results.
+                      Defaults to the ``linkedin.cache_imports`` config setting.
 
         Returns:
             Dictionary of profile data
@@ -81,6 +430,31 @@ class LinkedInSync:
         if not json_path.exists():
             raise FileNotFoundError(f"LinkedIn data file not found: {json_path}")
 
+        if use_cache is None:
+            use_cache = self.linkedin_config.get("cache_imports", False)
+        if not use_cache:
+            return self._import_export(json_path)
+
+        cache_key = self._get_cache_key(json_path)
+        resume_data = self._get_from_cache(cache_key)
+        if resume_data is not None:
+            resume_data["meta"]["last_updated"] = datetime.now().strftime("%Y-%m-%d")
+            return resume_data
+
+        resume_data = self._import_export(json_path)
+        self._save_to_cache(cache_key, resume_data)
+        return resume_data
+
+    def _import_export(self, json_path: Path) -> Dict[str, Any]:
+        """
+        Import a LinkedIn export, dispatching on its format.
+
+        Args:
+            json_path: Path to LinkedIn export file (JSON, CSV, or folder)
+
+        Returns:
+            Dictionary of profile data
+        """
         # Check if it's a directory (folder-based LinkedIn export)
         if json_path.is_dir():
             return self._import_from_folder(json_path)
@@ -96,6 +470,92 @@ class LinkedInSync:
             # Try to detect format by reading first character
             return self._import_from_json_file(json_path)
 
+    def _get_cache_key(self, json_path: Path) -> str:
+        """
+        Generate a cache key from the export's location, size and modification time.
+
+        Folder exports are keyed on the stats of every file they contain, so editing
+        any CSV in the folder invalidates the cached result. The key starts with a
+        hash of the export's location, so stale entries for the same export can be
+        found and evicted.
+
+        Args:
+            json_path: Path to LinkedIn export file or folder
+
+        Returns:
+            Hash string for caching, as ``<source hash>-<state hash>``
+        """
+        if json_path.is_dir():
+            with os.scandir(json_path) as entries:
+                stats = sorted(
+                    (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                    for entry in entries
+                    if entry.is_file()
+                )
+        else:
+            stat = json_path.stat()
+            stats = [(stat.st_mtime_ns, stat.st_size)]
+
+        source = str(json_path.resolve())
+        fingerprint = f"{source}|{stats}|{self._IMPORT_CACHE_VERSION}"
+        # Note: MD5 is used for cache keys only, not for security purposes
+        source_hash = hashlib.md5(source.encode()).hexdigest()  # nosec
+        return f"{source_hash}-{hashlib.md5(fingerprint.encode()).hexdigest()}"  # nosec
+
+    def _get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached import result.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Cached resume data or None
+        """
+        try:
+            with open(self.cache_dir / f"{cache_key}.json", encoding="utf-8") as f:
+                return json.load(f)
+        except (ValueError, IOError):
+            return None
+
+    def _save_to_cache(self, cache_key: str, resume_data: Dict[str, Any]) -> None:
+        """
+        Save an import result to the cache.
+
+        Caching is best-effort; an unwritable cache directory does not fail the import.
+        Older entries for the same export are removed, keeping one file per export.
+
+        Args:
+            cache_key: Cache key
+            resume_data: Imported resume data
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            source_hash = cache_key.split("-", 1)[0]
+            for stale in self.cache_dir.glob(f"{source_hash}-*.json"):
+                stale.unlink()
+            with open(self.cache_dir / f"{cache_key}.json", "w", encoding="utf-8") as f:
+                json.dump(resume_data, f)
+        except IOError:
+            pass
+
+    def clear_cache(self) -> int:
+        """
+        Clear all cached import results.
+
+        Returns:
+            Number of files cleared
+        """
+        count = 0
+        if not self.cache_dir.is_dir():
+            return count
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".json"):
+                    os.unlink(entry.path)
+                    count += 1
+        return count
+
     def _import_from_folder(self, folder_path: Path) -> Dict[str, Any]:
         """
         Import LinkedIn profile data from a folder export.
@@ -110,38 +570,49 @@ class LinkedInSync:
         """
         linkedin_data = {}
 
-        # Define the expected CSV files and their data keys
+        # Define the expected CSV files, their data keys, and the columns the mapping reads
+        profile_fields = set(self._csv_field_mapping) | self._alias_fields(self._PROFILE_ALIASES)
         csv_mappings = {
-            "Profile.csv": "profile",
-            "Positions.csv": "positions",
-            "Education.csv": "education",
-            "Skills.csv": "skills",
-            "Certifications.csv": "certifications",
+            "Profile.csv": ("profile", profile_fields),
+            "Positions.csv": ("positions", self._alias_fields(self._EXPERIENCE_ALIASES)),
+            "Education.csv": (
+                "education",
+                self._alias_fields(self._EDUCATION_ALIASES) | {"Notes"},
+            ),
+            "Skills.csv": ("skills", self._alias_fields(self._SKILL_ALIASES)),
+            "Certifications.csv": (
+                "certifications",
+                self._alias_fields(self._CERTIFICATION_ALIASES),
+            ),
         }
 
-        for csv_file, data_key in csv_mappings.items():
-            csv_path = folder_path / csv_file
-            if csv_path.exists():
+        # List the folder once instead of probing each expected file separately
+        with os.scandir(folder_path) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+
+        for csv_file, (data_key, fields) in csv_mappings.items():
+            if csv_file in present:
                 try:
-                    data = self._read_csv_file(csv_path, csv_file)
+                    data = self._read_csv_file(folder_path / csv_file, csv_file, fields)
                     if data:
                         linkedin_data[data_key] = data
                 except Exception as e:
                     # Log but continue - some files may be missing or malformed
-                    import logging
-
-                    logging.warning(f"Error reading {csv_file}: {e}")
+                    logger.warning(f"Error reading {csv_file}: {e}")
 
         # Also check for Profile Summary.csv
-        profile_summary_path = folder_path / "Profile Summary.csv"
-        if profile_summary_path.exists():
+        if "Profile Summary.csv" in present:
             try:
-                summary_data = self._read_csv_file(profile_summary_path, "Profile Summary.csv")
+                summary_data = self._read_csv_file(
+                    folder_path / "Profile Summary.csv", "Profile Summary.csv", {"Summary"}
+                )
                 if summary_data and len(summary_data) > 0:
                     # The Profile Summary CSV typically has 'Summary' column
                     row = summary_data[0]
                     if "Summary" in row and row["Summary"]:
-                        linkedin_data["profile"]["summary"] = row["Summary"]
+                        # Profile rows are a list of dicts; attach the summary to the first
+                        profile_rows = linkedin_data.setdefault("profile", [{}])
+                        profile_rows[0]["summary"] = row["Summary"]
             except Exception:
                 pass
 
@@ -150,26 +621,72 @@ class LinkedInSync:
 
         return resume_data
 
-    def _read_csv_file(self, csv_path: Path, file_name: str) -> List[Dict[str, Any]]:
+    def _read_csv_file(
+        self, csv_path: Path, file_name: str, fields: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Read a CSV file and return list of dictionaries.
 
         Args:
             csv_path: Path to CSV file
             file_name: Name of file for field mapping
+            fields: Columns to keep; all columns are kept if None
 
         Returns:
-            List of row dictionaries
+            List of row dictionaries with stripped values
         """
         rows = []
-        with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        with open(csv_path, encoding="utf-8-sig", buffering=_READ_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                return rows
+
+            # Only the selected columns are copied and stripped
+            columns = [
+                (name, index)
+                for index, name in enumerate(header)
+                if fields is None or name in fields
+            ]
+            width = len(header)
             for row in reader:
-                # Clean up empty values
-                cleaned_row = {k: v.strip() if v else "" for k, v in row.items()}
-                rows.append(cleaned_row)
+                if not row:
+                    continue
+                # Pad short rows so missing trailing columns read as empty values
+                if len(row) < width:
+                    row += [""] * (width - len(row))
+                rows.append({name: row[index].strip() for name, index in columns})
         return rows
 
+    @staticmethod
+    def _alias_fields(aliases: Dict[str, Tuple[str, ...]]) -> Set[str]:
+        """
+        Collect every key name listed in an alias table.
+
+        Args:
+            aliases: Alias table mapping canonical fields to candidate keys
+
+        Returns:
+            Set of all candidate key names
+        """
+        return {name for names in aliases.values() for name in names}
+
+    @staticmethod
+    def _csv_cell(row: List[str], index: Optional[int]) -> str:
+        """
+        Get a CSV cell by column index.
+
+        Args:
+            row: CSV row values
+            index: Column index, or None if the column is not in the header
+
+        Returns:
+            Cell value, or "" if the column or cell is missing
+        """
+        if index is None or index >= len(row):
+            return ""
+        return row[index]
+
     def _import_from_json_file(self, json_path: Path) -> Dict[str, Any]:
         """
         Import LinkedIn profile data from JSON file.
@@ -181,9 +698,8 @@ class LinkedInSync:
             Dictionary of profile data
         """
         try:
-            with open(json_path, encoding="utf-8") as f:
-                linkedin_data = json.load(f)
-        except json.JSONDecodeError as e:
+            linkedin_data = self._load_json_export(json_path)
+        except (json.JSONDecodeError, _IJSON_ERRORS) as e:
             raise ValueError(
                 f"Invalid JSON file: {json_path}. "
                 f"The file appears to be in CSV format. "
@@ -196,6 +712,54 @@ class LinkedInSync:
 
         return resume_data
 
+    def _load_json_export(self, json_path: Path) -> Dict[str, Any]:
+        """
+        Load the top-level keys of a LinkedIn JSON export that the mapping uses.
+
+        Exports are parsed in one go, with orjson when it is installed. Very large
+        exports are streamed with ijson when it is installed instead: values under
+        other top-level keys are discarded as they are parsed, so peak memory stays
+        proportional to the imported sections rather than the whole export.
+
+        Args:
+            json_path: Path to LinkedIn export JSON file
+
+        Returns:
+            Dictionary of LinkedIn export data
+        """
+        with open(json_path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+            # Parsers read raw bytes here, so skip a UTF-8 BOM by hand
+            if f.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+                f.seek(0)
+
+            if ijson is not None and os.fstat(f.fileno()).st_size >= _STREAM_JSON_MIN_BYTES:
+                wanted = self._json_export_keys()
+                return {
+                    key: value
+                    for key, value in ijson.kvitems(f, "", use_float=True)
+                    if key in wanted
+                }
+
+            raw = f.read()
+
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson is stricter (e.g. NaN, integers over 64 bits); let json decide
+                pass
+        return json.loads(raw)
+
+    @classmethod
+    def _json_export_keys(cls) -> frozenset:
+        """Top-level JSON export keys read by _map_linkedin_to_resume."""
+        keys = {"profile", "Profile"}
+        # Profile fields may also sit at the top level of the export
+        for aliases in (cls._SECTION_ALIASES, cls._PROFILE_ALIASES):
+            for names in aliases.values():
+                keys.update(names)
+        return frozenset(keys)
+
     def _import_from_csv(self, csv_path: Path) -> Dict[str, Any]:
         """
         Import LinkedIn profile data from CSV file.
@@ -210,45 +774,72 @@ class LinkedInSync:
         """
         linkedin_data = {}
 
-        with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-            if not rows:
-                raise ValueError(f"CSV file is empty: {csv_path}")
-
-            # Get the first (and usually only) row for profile data
-            row = rows[0]
-
-            # Map CSV columns to internal format using the field mapping
-            for csv_field, internal_key in self._csv_field_mapping.items():
-                if csv_field in row and row[csv_field]:
-                    linkedin_data[internal_key] = row[csv_field]
-
-            # Handle positions/experience if present in CSV
-            # (Basic CSV export may not have this, but check for additional rows)
-            if len(rows) > 1:
-                positions = []
-                for row in rows[1:]:
-                    # Check if this row has position data
-                    if row.get("Company") or row.get("Title"):
-                        position = {
-                            "company": row.get("Company", ""),
-                            "title": row.get("Title", ""),
-                            "location": row.get("Location", ""),
-                            "startDate": row.get("Start Date", ""),
-                            "endDate": row.get("End Date", ""),
-                            "description": row.get("Description", ""),
-                        }
-                        positions.append(position)
-                if positions:
-                    linkedin_data["positions"] = positions
+        with open(csv_path, encoding="utf-8-sig", buffering=_READ_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            rows = [row for row in reader if row]
+
+        if not rows:
+            raise ValueError(f"CSV file is empty: {csv_path}")
+
+        # Resolve column positions once (last occurrence wins, as with csv.DictReader)
+        columns = {name: index for index, name in enumerate(header)}
+
+        # Get the first (and usually only) row for profile data
+        row = rows[0]
+
+        # Map CSV columns to internal format using the field mapping
+        for csv_field, internal_key in self._csv_field_mapping.items():
+            value = self._csv_cell(row, columns.get(csv_field))
+            if value:
+                linkedin_data[internal_key] = value
+
+        # Handle positions/experience if present in CSV
+        # (Basic CSV export may not have this, but check for additional rows)
+        if len(rows) > 1:
+            position_columns = [
+                (key, columns.get(csv_field))
+                for key, csv_field in (
+                    ("company", "Company"),
+                    ("title", "Title"),
+                    ("location", "Location"),
+                    ("startDate", "Start Date"),
+                    ("endDate", "End Date"),
+                    ("description", "Description"),
+                )
+            ]
+            positions = []
+            for row in rows[1:]:
+                position = {key: self._csv_cell(row, index) for key, index in position_columns}
+                # Check if this row has position data
+                if position["company"] or position["title"]:
+                    positions.append(position)
+            if positions:
+                linkedin_data["positions"] = positions
 
         # Map LinkedIn data to resume.yaml structure
         resume_data = self._map_linkedin_to_resume(linkedin_data)
 
         return resume_data
 
+    @staticmethod
+    def _first(data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+        """
+        Return the first truthy value found under any of the given keys.
+
+        Args:
+            data: Dictionary to look up
+            keys: Candidate keys in priority order
+
+        Returns:
+            First truthy value, or "" if none of the keys has one
+        """
+        for key in keys:
+            value = data.get(key)
+            if value:
+                return value
+        return ""
+
     def _map_linkedin_to_resume(self, linkedin_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Map LinkedIn profile data to resume.yaml structure.
@@ -259,14 +850,16 @@ class LinkedInSync:
         Returns:
             Dictionary matching resume.yaml schema
         """
+        profile_data = self._normalize_profile(linkedin_data)
+
         resume_data = {
             "meta": {
                 "version": "2.0.0",
                 "last_updated": datetime.now().strftime("%Y-%m-%d"),
                 "source": "linkedin_import",
             },
-            "contact": self._extract_contact(linkedin_data),
-            "professional_summary": self._extract_summary(linkedin_data),
+            "contact": self._extract_contact(linkedin_data, profile_data),
+            "professional_summary": self._extract_summary(linkedin_data, profile_data),
             "skills": self._extract_skills(linkedin_data),
             "experience": self._extract_experience(linkedin_data),
             "education": self._extract_education(linkedin_data),
@@ -277,10 +870,17 @@ class LinkedInSync:
 
         return resume_data
 
-    def _extract_contact(self, linkedin_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract contact information from LinkedIn data."""
-        contact = {}
+    @staticmethod
+    def _normalize_profile(linkedin_data: Dict[str, Any]) -> Any:
+        """
+        Resolve the profile record from LinkedIn data.
+
+        Args:
+            linkedin_data: Parsed LinkedIn export data
 
+        Returns:
+            Profile record, unwrapped from the list format used by folder exports
+        """
         # LinkedIn export data structure varies by export format
         # Try multiple common paths
         profile_data = (
@@ -291,55 +891,47 @@ class LinkedInSync:
         if isinstance(profile_data, list) and len(profile_data) > 0:
             profile_data = profile_data[0]
 
+        return profile_data
+
+    def _extract_contact(
+        self, linkedin_data: Dict[str, Any], profile_data: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """Extract contact information from LinkedIn data."""
+        contact = {}
+
+        if profile_data is None:
+            profile_data = self._normalize_profile(linkedin_data)
+
+        aliases = self._PROFILE_ALIASES
+
         # Extract name - handle CSV format with "First Name" and "Last Name"
-        first_name = (
-            profile_data.get("firstName")
-            or profile_data.get("first_name")
-            or profile_data.get("FirstName")
-            or profile_data.get("First Name")
-        )
-        last_name = (
-            profile_data.get("lastName")
-            or profile_data.get("last_name")
-            or profile_data.get("LastName")
-            or profile_data.get("Last Name")
-        )
+        first_name = self._first(profile_data, aliases["first_name"])
+        last_name = self._first(profile_data, aliases["last_name"])
 
         if first_name and last_name:
             contact["name"] = f"{first_name} {last_name}"
-        elif profile_data.get("fullName") or profile_data.get("full_name"):
-            contact["name"] = profile_data.get("fullName") or profile_data.get("full_name")
+        else:
+            full_name = self._first(profile_data, aliases["full_name"])
+            if full_name:
+                contact["name"] = full_name
 
         # Extract email
-        email = (
-            profile_data.get("email")
-            or profile_data.get("Email")
-            or profile_data.get("emailAddress")
-        )
+        email = self._first(profile_data, aliases["email"])
         if email:
             contact["email"] = email
 
         # Extract phone
-        phone = (
-            profile_data.get("phone")
-            or profile_data.get("Phone")
-            or profile_data.get("phoneNumber")
-        )
+        phone = self._first(profile_data, aliases["phone"])
         if phone:
             contact["phone"] = phone
 
         # Extract headline (for profile display)
-        headline = profile_data.get("headline") or profile_data.get("Headline")
+        headline = self._first(profile_data, aliases["headline"])
         if headline:
             contact["headline"] = headline
 
         # Extract location - handle dict format (JSON) and string format (CSV)
-        location = (
-            profile_data.get("location")
-            or profile_data.get("Location")
-            or profile_data.get("geoLocation")
-            or profile_data.get("Geo Location")
-        )
+        location = self._first(profile_data, aliases["location"])
         if location:
             if isinstance(location, dict):
                 # JSON format: {"city": "...", "region": "..."}
@@ -351,72 +943,61 @@ class LinkedInSync:
                 contact["location"] = {"full": location}
 
         # Extract URLs from Websites field (CSV format)
-        websites = profile_data.get("websites") or profile_data.get("Websites") or ""
+        websites = self._first(profile_data, aliases["websites"])
         if websites:
             urls = {}
-            # Parse website URLs (may be comma-separated)
+            # Parse website URLs (may be comma-separated); zip keeps at most len(_URL_KEYS)
             if isinstance(websites, str):
                 website_list = [w.strip() for w in websites.split(",") if w.strip()]
-                for i, url in enumerate(website_list[:3]):  # Limit to 3 URLs
-                    if i == 0:
-                        urls["website"] = url
-                    else:
-                        urls[f"website_{i+1}"] = url
+                urls = dict(zip(self._URL_KEYS, website_list))
             if urls:
                 contact["urls"] = urls
 
         # Extract industry (for reference)
-        industry = profile_data.get("industry") or profile_data.get("Industry")
+        industry = self._first(profile_data, aliases["industry"])
         if industry:
             contact["industry"] = industry
 
         return contact
 
-    def _extract_summary(self, linkedin_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_summary(
+        self, linkedin_data: Dict[str, Any], profile_data: Optional[Any] = None
+    ) -> Dict[str, Any]:
         """Extract professional summary from LinkedIn data."""
-        profile_data = (
-            linkedin_data.get("profile", {}) or linkedin_data.get("Profile", {}) or linkedin_data
-        )
-
-        # Handle list format from CSV (folder export)
-        if isinstance(profile_data, list) and len(profile_data) > 0:
-            profile_data = profile_data[0]
+        if profile_data is None:
+            profile_data = self._normalize_profile(linkedin_data)
 
-        summary = (
-            profile_data.get("summary")
-            or profile_data.get("Summary")
-            or profile_data.get("headline")
-            or profile_data.get("Headline")
-            or ""
-        )
+        summary = self._first(profile_data, self._PROFILE_ALIASES["summary"])
 
         return {"base": summary, "variants": {}}
 
     def _extract_skills(self, linkedin_data: Dict[str, Any]) -> Dict[str, List[str]]:
         """Extract skills from LinkedIn data."""
-        skills_data = linkedin_data.get("skills") or linkedin_data.get("Skills") or []
+        skills_data = self._first(linkedin_data, self._SECTION_ALIASES["skills"])
 
         if not isinstance(skills_data, list):
             # Try nested structure
             skills_data = []
 
-        # Extract skill names - handle CSV format with "Name" column
+        # Extract skill names - handle CSV format with "Name" column. Exports can repeat
+        # a skill (e.g. across endorsement rows), so keep only the first spelling of each
         skill_names = []
+        seen = set()
+        first = self._first
+        name_keys = self._SKILL_ALIASES["name"]
         for skill in skills_data:
             if isinstance(skill, dict):
-                name = (
-                    skill.get("name")
-                    or skill.get("Name")
-                    or skill.get("skillName")
-                    or skill.get("skillName")
-                )
+                name = first(skill, name_keys)
             elif isinstance(skill, str):
                 name = skill
             else:
                 continue
 
             if name:
-                skill_names.append(name)
+                key = name.casefold()
+                if key not in seen:
+                    seen.add(key)
+                    skill_names.append(name)
 
         # Categorize skills (simple keyword-based categorization)
         categorized = self._categorize_skills(skill_names)
@@ -442,108 +1023,15 @@ class LinkedInSync:
             "other": [],
         }
 
-        language_keywords = [
-            "python",
-            "javascript",
-            "java",
-            "go",
-            "rust",
-            "c\\+\\+",
-            "c#",
-            "ruby",
-            "php",
-            "swift",
-            "kotlin",
-            "scala",
-            "haskell",
-            "typescript",
-            "sql",
-        ]
-
-        framework_keywords = [
-            "django",
-            "flask",
-            "fastapi",
-            "spring",
-            "react",
-            "angular",
-            "vue",
-            "express",
-            "rails",
-            "laravel",
-            "next\\.js",
-            "nuxt",
-            "tensorflow",
-            "pytorch",
-            "keras",
-            "pandas",
-            "numpy",
-            "scikit",
-            "langchain",
-        ]
-
-        cloud_keywords = [
-            "aws",
-            "azure",
-            "gcp",
-            "google cloud",
-            "amazon web services",
-            "heroku",
-            "vercel",
-            "netlify",
-            "digitalocean",
-            "linode",
-        ]
-
-        database_keywords = [
-            "postgres",
-            "postgresql",
-            "mysql",
-            "mongodb",
-            "redis",
-            "sqlite",
-            "oracle",
-            "sql server",
-            "cassandra",
-            "elasticsearch",
-            "dynamodb",
-        ]
-
-        tool_keywords = [
-            "docker",
-            "kubernetes",
-            "git",
-            "github",
-            "gitlab",
-            "jenkins",
-            "circleci",
-            "terraform",
-            "ansible",
-            "nagios",
-            "grafana",
-            "prometheus",
-        ]
-
         for skill in skills:
             skill_lower = skill.lower()
 
             # Check each category (use first match)
-            matched = False
-            patterns = [
-                (language_keywords, "languages"),
-                (framework_keywords, "frameworks"),
-                (cloud_keywords, "cloud_platforms"),
-                (database_keywords, "databases"),
-                (tool_keywords, "tools"),
-            ]
-
-            for keywords, category in patterns:
-                if any(re.search(rf"\b{kw}\b", skill_lower) for kw in keywords):
+            for pattern, category in _SKILL_CATEGORY_PATTERNS:
+                if pattern.search(skill_lower):
                     categories[category].append(skill)
-                    matched = True
                     break
-
-            if not matched:
+            else:
                 categories["other"].append(skill)
 
         # Remove empty categories
@@ -551,94 +1039,67 @@ class LinkedInSync:
 
     def _extract_experience(self, linkedin_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract work experience from LinkedIn data."""
-        experience_data = (
-            linkedin_data.get("experience")
-            or linkedin_data.get("Experience")
-            or linkedin_data.get("positions")
-            or linkedin_data.get("Positions")
-            or []
-        )
+        experience_data = self._first(linkedin_data, self._SECTION_ALIASES["experience"])
 
         if not isinstance(experience_data, list):
             return []
 
-        experience = []
-        for exp in experience_data:
-            if not isinstance(exp, dict):
-                continue
+        # Build, filter and sort in one pipeline; entries come decorated with their sort key
+        entries = (
+            self._build_experience_entry(exp) for exp in experience_data if isinstance(exp, dict)
+        )
+        experience = sorted(
+            (entry for entry in entries if entry is not None), key=itemgetter(0), reverse=True
+        )
 
-            # Handle different CSV column names from folder export
-            # CSV format: "Company Name", "Title", "Description", "Location", "Started On", "Finished On"
-            company = (
-                exp.get("company")
-                or exp.get("CompanyName")
-                or exp.get("companyName")
-                or exp.get("Company Name")
-                or ""
-            )
+        # Sorted by start date (most recent first)
+        return [entry for _, entry in experience]
 
-            title = (
-                exp.get("title")
-                or exp.get("Title")
-                or exp.get("jobTitle")
-                or exp.get("Job Title")
-                or ""
-            )
+    def _build_experience_entry(
+        self, exp: Dict[str, Any]
+    ) -> Optional[Tuple[Tuple[str, str], Dict[str, Any]]]:
+        """
+        Build a resume experience entry from a LinkedIn position.
 
-            if not company or not title:
-                continue
+        Args:
+            exp: LinkedIn position record
 
-            # Parse dates - handle CSV format "Started On", "Finished On"
-            start_date = self._parse_linkedin_date(
-                exp.get("startDate")
-                or exp.get("start_date")
-                or exp.get("Started On")
-                or exp.get("start_date")
-            )
-            end_date = self._parse_linkedin_date(
-                exp.get("endDate")
-                or exp.get("end_date")
-                or exp.get("Finished On")
-                or exp.get("end_date")
-            )
+        Returns:
+            Tuple of (sort key, experience entry), or None if company or title is missing
+        """
+        aliases = self._EXPERIENCE_ALIASES
+        company = self._first(exp, aliases["company"])
+        title = self._first(exp, aliases["title"])
 
-            # Handle empty end date (current position)
-            if end_date == "" or end_date is None:
-                end_date = "Present"
-
-            # Location - handle CSV format
-            location = (
-                exp.get("location")
-                or exp.get("Location")
-                or exp.get("companyLocation")
-                or exp.get("Company Location")
-                or ""
-            )
+        if not company or not title:
+            return None
 
-            # Description/bullets - handle CSV format
-            description = (
-                exp.get("description") or exp.get("Description") or exp.get("Description") or ""
-            )
+        start_date = self._parse_linkedin_date(self._first(exp, aliases["start_date"]))
+        end_date = self._parse_linkedin_date(self._first(exp, aliases["end_date"]))
 
-            bullets = self._parse_description_to_bullets(description)
+        # Handle empty end date (current position)
+        if end_date == "" or end_date is None:
+            end_date = "Present"
 
-            experience_entry = {
-                "company": company,
-                "title": title,
-                "start_date": start_date,
-                "end_date": end_date,
-                "location": location,
-                "bullets": bullets,
-            }
+        location = self._first(exp, aliases["location"])
 
-            experience.append(experience_entry)
+        # Description/bullets
+        description = self._first(exp, aliases["description"])
 
-        # Sort by start date (most recent first)
-        experience.sort(
-            key=lambda x: (x["start_date"] or "1900-01", x["end_date"] or "9999-12"), reverse=True
-        )
+        bullets = self._parse_description_to_bullets(description)
 
-        return experience
+        experience_entry = {
+            "company": company,
+            "title": title,
+            "start_date": start_date,
+            "end_date": end_date,
+            "location": location,
+            "bullets": bullets,
+        }
+
+        # Decorate with the sort key while the dates are still at hand
+        sort_key = (start_date or "1900-01", end_date or "9999-12")
+        return sort_key, experience_entry
 
     def _parse_linkedin_date(self, date_str: Optional[str]) -> Optional[str]:
         """
@@ -653,22 +1114,7 @@ class LinkedInSync:
         if not date_str:
             return None
 
-        # Common LinkedIn date formats
-        formats = ["%Y-%m-%d", "%Y-%m", "%B %Y", "%b %Y", "%Y", "%m/%Y", "%m/%d/%Y"]
-
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt.strftime("%Y-%m")
-            except ValueError:
-                continue
-
-        # Try extracting year from string
-        year_match = re.search(r"\b(19|20)\d{2}\b", date_str)
-        if year_match:
-            return f"{year_match.group()}-01"
-
-        return None
+        return _parse_date_cached(date_str)
 
     def _parse_description_to_bullets(self, description: str) -> List[Dict[str, Any]]:
         """
@@ -683,12 +1129,18 @@ class LinkedInSync:
         if not description:
             return []
 
-        # Split by common bullet indicators
-        bullet_pattern = r"[\n•\-\*]+\s*"
-        raw_bullets = re.split(bullet_pattern, description)
+        # Split by newlines and common bullet indicators. Empty and whitespace-only
+        # pieces between adjacent separators are dropped by the length filter below.
+        raw_bullets = (
+            description.replace("•", "\n").replace("-", "\n").replace("*", "\n").split("\n")
+        )
 
         bullets = []
         for text in raw_bullets:
+            # Stripping only shortens, so short pieces (mostly the empty ones between
+            # adjacent separators) are rejected before allocating a stripped copy
+            if len(text) <= 10:
+                continue
             text = text.strip()
             if len(text) > 10:  # Ignore very short bullets
                 bullets.append({"text": text, "skills": [], "emphasize_for": []})
@@ -701,57 +1153,31 @@ class LinkedInSync:
 
     def _extract_education(self, linkedin_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract education from LinkedIn data."""
-        education_data = linkedin_data.get("education") or linkedin_data.get("Education") or []
+        education_data = self._first(linkedin_data, self._SECTION_ALIASES["education"])
 
         if not isinstance(education_data, list):
             return []
 
+        aliases = self._EDUCATION_ALIASES
         education = []
         for edu in education_data:
             if not isinstance(edu, dict):
                 continue
 
-            # Handle CSV column names from folder export
-            # CSV format: "School Name", "Start Date", "End Date", "Notes", "Degree Name", "Activities"
-            institution = (
-                edu.get("school")
-                or edu.get("School")
-                or edu.get("schoolName")
-                or edu.get("institution")
-                or edu.get("School Name")
-                or ""
-            )
-
-            degree = (
-                edu.get("degree")
-                or edu.get("Degree")
-                or edu.get("degreeName")
-                or edu.get("Degree Name")
-                or ""
-            )
+            institution = self._first(edu, aliases["institution"])
+            degree = self._first(edu, aliases["degree"])
 
             if not institution:
                 continue
 
             # Parse graduation date - handle CSV format "End Date"
-            grad_date = self._parse_linkedin_date(
-                edu.get("endDate")
-                or edu.get("end_date")
-                or edu.get("graduationYear")
-                or edu.get("End Date")
-            )
+            grad_date = self._parse_linkedin_date(self._first(edu, aliases["end_date"]))
 
             # Location (not typically in CSV, but handle anyway)
-            location = edu.get("schoolLocation") or edu.get("location") or edu.get("Location") or ""
+            location = self._first(edu, aliases["location"])
 
             # Field of study - handle CSV "Notes" column sometimes contains field info
-            field = (
-                edu.get("fieldOfStudy")
-                or edu.get("field_of_study")
-                or edu.get("field")
-                or edu.get("Field of Study")
-                or ""
-            )
+            field = self._first(edu, aliases["field"])
 
             # If field is empty but Notes contains info, use Notes for field
             if not field and edu.get("Notes"):
@@ -765,63 +1191,37 @@ class LinkedInSync:
                 "field": field,
             }
 
-            education.append(education_entry)
+            education.append((grad_date or "1900-01", education_entry))
 
         # Sort by graduation date (most recent first)
-        education.sort(key=lambda x: (x["graduation_date"] or "1900-01"), reverse=True)
+        education.sort(key=itemgetter(0), reverse=True)
 
-        return education
+        return [entry for _, entry in education]
 
     def _extract_certifications(self, linkedin_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract certifications from LinkedIn data."""
-        cert_data = (
-            linkedin_data.get("certifications")
-            or linkedin_data.get("Certifications")
-            or linkedin_data.get("certifications")
-            or []
-        )
+        cert_data = self._first(linkedin_data, self._SECTION_ALIASES["certifications"])
 
         if not isinstance(cert_data, list):
             return []
 
+        aliases = self._CERTIFICATION_ALIASES
         certifications = []
         for cert in cert_data:
             if not isinstance(cert, dict):
                 continue
 
-            # Handle CSV column names from folder export
-            # CSV format: "Name", "Url", "Authority", "Started On", "Finished On", "License Number"
-            name = (
-                cert.get("name")
-                or cert.get("Name")
-                or cert.get("certificationName")
-                or cert.get("Certification Name")
-                or ""
-            )
-
+            name = self._first(cert, aliases["name"])
             if not name:
                 continue
 
             # Issuing organization - handle CSV "Authority" column
-            authority = (
-                cert.get("authority")
-                or cert.get("Authority")
-                or cert.get("issuingOrganization")
-                or cert.get("Issuer")
-                or ""
-            )
+            authority = self._first(cert, aliases["authority"])
 
             # Date - handle CSV "Started On" and "Finished On" columns
-            date = self._parse_linkedin_date(
-                cert.get("startDate")
-                or cert.get("start_date")
-                or cert.get("issueDate")
-                or cert.get("Started On")
-                or cert.get("Finished On")
-            )
+            date = self._parse_linkedin_date(self._first(cert, aliases["date"]))
 
-            # URL
-            url = cert.get("url") or cert.get("Url") or cert.get("URL") or ""
+            url = self._first(cert, aliases["url"])
 
             certifications.append(
                 {"name": name, "issuer": authority, "date": date or "", "url": url}
@@ -829,21 +1229,26 @@ class LinkedInSync:
 
         return certifications
 
-    def export_to_linkedin_format(self, yaml_path: Path, output_path: Optional[Path] = None) -> str:
+    def export_to_linkedin_format(
+        self,
+        yaml_path: Path,
+        output_path: Optional[Path] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> str:
         """
         Export resume.yaml data to LinkedIn-friendly format.
 
         Args:
             yaml_path: Path to resume.yaml
             output_path: Optional output file path
+            data: Optional already-loaded resume data; yaml_path is not read if provided
 
         Returns:
             LinkedIn-formatted text
         """
-        from ..utils.yaml_parser import ResumeYAML
-
-        yaml_handler = ResumeYAML(yaml_path)
-        data = yaml_handler.load()
+        if data is None:
+            yaml_handler = ResumeYAML(yaml_path)
+            data = yaml_handler.load()
 
         # Build LinkedIn-formatted content
         sections = []
@@ -858,72 +1263,70 @@ class LinkedInSync:
         if experience:
             sections.append("\nExperience:")
             for exp in experience:
-                sections.append(f"\n{exp.get('title', '')} | {exp.get('company', '')}")
+                # Build each entry locally and append it as one section
+                lines = [f"\n{exp.get('title', '')} | {exp.get('company', '')}"]
                 if exp.get("location"):
-                    sections.append(f"Location: {exp['location']}")
+                    lines.append(f"Location: {exp['location']}")
 
                 # Format dates
                 start = exp.get("start_date", "")
                 end = exp.get("end_date") or "Present"
                 if start:
-                    sections.append(f"{self._format_date_range(start, end)}")
+                    lines.append(self._format_date_range(start, end))
 
                 # Bullets
-                bullets = exp.get("bullets", [])
-                for bullet in bullets:
-                    if isinstance(bullet, dict):
-                        text = bullet.get("text", "")
-                    else:
-                        text = str(bullet)
-                    if text:
-                        sections.append(f"• {text}")
+                bullet_texts = (
+                    bullet.get("text", "") if isinstance(bullet, dict) else str(bullet)
+                    for bullet in exp.get("bullets", [])
+                )
+                lines.extend(f"• {text}" for text in bullet_texts if text)
+                sections.append("\n".join(lines))
 
         # Skills
         skills = data.get("skills", {})
         if skills:
             sections.append("\n\nSkills:")
-            for category, skill_list in skills.items():
-                if skill_list:
-                    skill_names = []
-                    for s in skill_list:
-                        skill_names.append(s if isinstance(s, str) else s.get("name", ""))
-                    sections.append(f"{category.title()}: {', '.join(skill_names)}")
+            sections.extend(
+                f"{category.title()}: "
+                + ", ".join(s if isinstance(s, str) else s.get("name", "") for s in skill_list)
+                for category, skill_list in skills.items()
+                if skill_list
+            )
 
         # Education
         education = data.get("education", [])
         if education:
             sections.append("\n\nEducation:")
             for edu in education:
-                sections.append(f"\n{edu.get('institution', '')}")
+                lines = [f"\n{edu.get('institution', '')}"]
                 if edu.get("degree"):
-                    sections.append(f"{edu.get('degree', '')}")
+                    lines.append(f"{edu.get('degree', '')}")
                 if edu.get("field"):
-                    sections.append(f"Field: {edu['field']}")
+                    lines.append(f"Field: {edu['field']}")
                 if edu.get("graduation_date"):
-                    sections.append(f"Graduated: {edu['graduation_date']}")
+                    lines.append(f"Graduated: {edu['graduation_date']}")
+                sections.append("\n".join(lines))
 
         # Certifications
         certifications = data.get("certifications", [])
         if certifications:
             sections.append("\n\nCertifications:")
             for cert in certifications:
-                name = cert.get("name", "")
                 issuer = cert.get("issuer", "")
                 date = cert.get("date", "")
-                cert_line = f"• {name}"
-                if issuer:
-                    cert_line += f" - {issuer}"
-                if date:
-                    cert_line += f" ({date})"
-                sections.append(cert_line)
+                sections.append(
+                    f"• {cert.get('name', '')}"
+                    + (f" - {issuer}" if issuer else "")
+                    + (f" ({date})" if date else "")
+                )
 
         linkedin_content = "\n".join(sections)
 
         # Save to file if path provided
         if output_path:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(linkedin_content)
+            # One encoded write; skips the text layer's newline translation pass
+            output_path.write_bytes(linkedin_content.encode("utf-8"))
 
         return linkedin_content
 
@@ -939,19 +1342,11 @@ class LinkedInSync:
             Formatted date range
         """
         # Convert YYYY-MM to month year format
-        try:
-            start_dt = datetime.strptime(start, "%Y-%m")
-            start_formatted = start_dt.strftime("%b %Y")
-        except ValueError:
-            start_formatted = start
+        start_formatted = _format_month_year(start)
 
         if end == "Present" or not end:
             end_formatted = "Present"
         else:
-            try:
-                end_dt = datetime.strptime(end, "%Y-%m")
-                end_formatted = end_dt.strftime("%b %Y")
-            except ValueError:
-                end_formatted = end
+            end_formatted = _format_month_year(end)
 
         return f"{start_formatted} - {end_formatted}"
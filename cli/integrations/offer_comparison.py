@@ -1,17 +1,87 @@
 """Offer comparison and decision tool for job offers."""
 
 import json
+import math
 from dataclasses import asdict, dataclass
+from functools import cached_property, lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from rich.console import Console
-from rich.table import Table
+
+from ..utils.compat import DATACLASS_SLOTS
+
+# Optional fast JSON backend for the offers store
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Initialize console
 console = Console()
 
 
+def _all_finite(data: Any) -> bool:
+    """
+    Check that every float in nested dicts and lists is finite.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        False if any float is NaN or infinite
+    """
+    if isinstance(data, float):
+        return math.isfinite(data)
+    if isinstance(data, dict):
+        return all(_all_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return all(_all_finite(value) for value in data)
+    return True
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize data as JSON indented by two spaces, encoded as UTF-8.
+
+    Uses orjson when it is installed. orjson writes NaN and infinity as null,
+    so data holding them is serialized by json instead, which keeps them.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None and _all_finite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. integers over 64 bits; let json handle them
+            pass
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> Any:
+    """
+    Parse a JSON document, with orjson when it is installed.
+
+    Args:
+        raw: Encoded JSON document
+
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN, integers over 64 bits); let json decide
+            pass
+    return json.loads(raw)
+
+
 @dataclass
 class Offer:
     """Represents a job offer."""
@@ -27,9 +97,10 @@ class Offer:
     remote: bool = False
     notes: str = ""
 
-    def __post_init__(self):
-        """Calculate total compensation."""
-        self.total_compensation = self.base_salary + self.bonus + (self.equity / self.equity_years)
+    @cached_property
+    def total_compensation(self) -> float:
+        """Calculate total compensation on first use, so loading offers skips it."""
+        return self.base_salary + self.bonus + (self.equity / self.equity_years)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -41,7 +112,7 @@ class Offer:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UserPriorities:
     """User's priorities for offer comparison."""
 
@@ -67,7 +138,7 @@ class UserPriorities:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OfferScores:
     """Scored offer with weighted scores."""
 
@@ -90,19 +161,37 @@ class OfferComparison:
             storage_path: Path to store offers JSON file
         """
         if storage_path is None:
-            storage_path = Path.home() / ".resume-cli" / "offers.json"
+            storage_path = _default_storage_path()
 
         self.storage_path = storage_path
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         self.offers: List[Offer] = []
         self.priorities = UserPriorities()
+        # (mtime_ns, size) of the storage file as last loaded or saved
+        self._stamp: Optional[Tuple[int, int]] = None
         self._load_offers()
 
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of the storage file, or None if it doesn't exist."""
+        try:
+            stat = self.storage_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _reload_if_changed(self) -> None:
+        """Reload offers if the storage file changed since it was last loaded or saved."""
+        if self._file_stamp() != self._stamp:
+            self.offers = []
+            self.priorities = UserPriorities()
+            self._load_offers()
+
     def _load_offers(self) -> None:
         """Load offers from storage file."""
-        if self.storage_path.exists():
+        self._stamp = self._file_stamp()
+        if self._stamp is not None:
             try:
-                data = json.loads(self.storage_path.read_text())
+                data = _load_json(self.storage_path.read_bytes())
                 self.offers = [Offer.from_dict(o) for o in data.get("offers", [])]
                 if "priorities" in data:
                     self.priorities = UserPriorities(**data["priorities"])
@@ -120,13 +209,22 @@ class OfferComparison:
                 "benefits_weight": self.priorities.benefits_weight,
             },
         }
-        self.storage_path.write_text(json.dumps(data, indent=2))
+        # Write a temporary file and swap it in, so a failed write keeps the old store
+        tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+        tmp_path.write_bytes(_dump_json(data))
+        tmp_path.replace(self.storage_path)
+        self._stamp = self._file_stamp()
 
     def add_offer(self, offer: Offer) -> None:
         """Add a new offer."""
         self.offers.append(offer)
         self._save_offers()
 
+    def add_offers_bulk(self, offers: Iterable[Offer]) -> None:
+        """Add several offers, saving the storage file once."""
+        self.offers.extend(offers)
+        self._save_offers()
+
     def remove_offer(self, company: str) -> bool:
         """Remove an offer by company name."""
         initial_len = len(self.offers)
@@ -155,39 +253,45 @@ class OfferComparison:
         max_salary = max(o.total_compensation for o in self.offers) or 1
         max_benefits = max(o.benefits_value for o in self.offers) or 1
 
-        # Get normalized weights
+        # Get normalized weights as locals for the scoring pass
         weights = self.priorities.normalize()
+        salary_w = weights["salary"]
+        growth_w = weights["growth"]
+        wlb_w = weights["wlb"]
+        benefits_w = weights["benefits"]
 
         scored_offers = []
         for offer in self.offers:
-            scores = OfferScores(offer=offer)
-
             # Compensation score (0-10)
-            scores.compensation_score = (offer.total_compensation / max_salary) * 10
+            compensation_score = (offer.total_compensation / max_salary) * 10
 
             # Benefits score (0-10)
-            scores.benefits_score = (
-                (offer.benefits_value / max_benefits) * 10 if max_benefits > 0 else 5
-            )
+            benefits_score = (offer.benefits_value / max_benefits) * 10 if max_benefits > 0 else 5
 
             # Growth score (default based on equity)
-            scores.growth_score = min(10, (offer.equity / 100000) * 10) if offer.equity > 0 else 5
+            equity = offer.equity
+            growth_score = min(10, (equity / 100000) * 10) if equity > 0 else 5
 
             # Work-life balance score (default based on remote)
-            scores.wlb_score = 8 if offer.remote else 5
-
-            # Calculate weighted score
-            scores.weighted_score = (
-                scores.compensation_score * weights["salary"]
-                + scores.growth_score * weights["growth"]
-                + scores.wlb_score * weights["wlb"]
-                + scores.benefits_score * weights["benefits"]
+            wlb_score = 8 if offer.remote else 5
+
+            # Calculate weighted score and build the result in one construction
+            scored_offers.append(
+                OfferScores(
+                    offer,
+                    compensation_score,
+                    growth_score,
+                    wlb_score,
+                    benefits_score,
+                    compensation_score * salary_w
+                    + growth_score * growth_w
+                    + wlb_score * wlb_w
+                    + benefits_score * benefits_w,
+                )
             )
 
-            scored_offers.append(scores)
-
         # Sort by weighted score
-        scored_offers.sort(key=lambda x: x.weighted_score, reverse=True)
+        scored_offers.sort(key=attrgetter("weighted_score"), reverse=True)
         return scored_offers
 
     def generate_comparison_report(self) -> str:
@@ -206,25 +310,13 @@ class OfferComparison:
         lines.append("## Compensation Comparison")
         lines.append("")
 
-        table = Table()
-        table.add_column("Company", style="cyan")
-        table.add_column("Base Salary", style="green", justify="right")
-        table.add_column("Bonus", style="green", justify="right")
-        table.add_column("Equity (yr)", style="green", justify="right")
-        table.add_column("Total/yr", style="yellow", justify="right")
-
-        for scores in scored_offers:
-            o = scores.offer
-            total = o.total_compensation
-            table.add_row(
-                o.company,
-                f"${o.base_salary:,.0f}",
-                f"${o.bonus:,.0f}",
-                f"${o.equity // o.equity_years:,.0f}",
-                f"${total:,.0f}",
-            )
-
-        lines.append(table)
+        lines.append("| Company | Base Salary | Bonus | Equity (yr) | Total/yr |")
+        lines.append("|---|---:|---:|---:|---:|")
+        lines.extend(
+            f"| {o.company} | ${o.base_salary:,.0f} | ${o.bonus:,.0f} "
+            f"| ${o.equity // o.equity_years:,.0f} | ${o.total_compensation:,.0f} |"
+            for o in (scores.offer for scores in scored_offers)
+        )
         lines.append("")
 
         # Weighted scores
@@ -238,26 +330,14 @@ class OfferComparison:
         )
         lines.append("")
 
-        scores_table = Table()
-        scores_table.add_column("Company", style="cyan")
-        scores_table.add_column("Comp", style="green", justify="right")
-        scores_table.add_column("Growth", style="green", justify="right")
-        scores_table.add_column("WLB", style="green", justify="right")
-        scores_table.add_column("Benefits", style="green", justify="right")
-        scores_table.add_column("Weighted", style="yellow", justify="right")
-
-        for scores in scored_offers:
-            o = scores.offer
-            scores_table.add_row(
-                o.company,
-                f"{scores.compensation_score:.1f}/10",
-                f"{scores.growth_score:.1f}/10",
-                f"{scores.wlb_score:.1f}/10",
-                f"{scores.benefits_score:.1f}/10",
-                f"**{scores.weighted_score:.1f}**/10",
-            )
-
-        lines.append(scores_table)
+        lines.append("| Company | Comp | Growth | WLB | Benefits | Weighted |")
+        lines.append("|---|---:|---:|---:|---:|---:|")
+        lines.extend(
+            f"| {scores.offer.company} | {scores.compensation_score:.1f}/10 "
+            f"| {scores.growth_score:.1f}/10 | {scores.wlb_score:.1f}/10 "
+            f"| {scores.benefits_score:.1f}/10 | **{scores.weighted_score:.1f}**/10 |"
+            for scores in scored_offers
+        )
         lines.append("")
 
         # Recommendation
@@ -288,6 +368,32 @@ class OfferComparison:
         self._save_offers()
 
 
+def _default_storage_path() -> Path:
+    """Return the default offers storage file in the user's home directory."""
+    return Path.home() / ".resume-cli" / "offers.json"
+
+
+@lru_cache(maxsize=4)
+def _comparison_for(storage_path: Path) -> OfferComparison:
+    """Return the shared OfferComparison for a storage file."""
+    return OfferComparison(storage_path)
+
+
+def _get_comparison() -> OfferComparison:
+    """
+    Get the shared OfferComparison for the default storage file.
+
+    The instance is reused across the module-level helpers so offers are only
+    parsed again when the file changes on disk.
+
+    Returns:
+        Up-to-date OfferComparison
+    """
+    comparison = _comparison_for(_default_storage_path())
+    comparison._reload_if_changed()
+    return comparison
+
+
 def add_offer(
     company: str,
     role: str,
@@ -331,12 +437,30 @@ def add_offer(
         notes=notes,
     )
 
-    comparison = OfferComparison()
+    comparison = _get_comparison()
     comparison.add_offer(offer)
 
     return offer
 
 
+def add_offers(offers: Iterable[Offer]) -> List[Offer]:
+    """
+    Add several job offers at once.
+
+    Args:
+        offers: Offers to add
+
+    Returns:
+        List of added Offer objects
+    """
+    offers = list(offers)
+
+    comparison = _get_comparison()
+    comparison.add_offers_bulk(offers)
+
+    return offers
+
+
 def compare_offers() -> List[OfferScores]:
     """
     Compare all stored offers.
@@ -344,7 +468,7 @@ def compare_offers() -> List[OfferScores]:
     Returns:
         List of scored offers
     """
-    comparison = OfferComparison()
+    comparison = _get_comparison()
     return comparison.compare_offers()
 
 
@@ -355,7 +479,7 @@ def generate_report() -> str:
     Returns:
         Markdown-formatted report
     """
-    comparison = OfferComparison()
+    comparison = _get_comparison()
     return comparison.generate_comparison_report()
 
 
@@ -380,5 +504,5 @@ def set_priorities(
         wlb_weight=wlb,
         benefits_weight=benefits,
     )
-    comparison = OfferComparison()
+    comparison = _get_comparison()
     comparison.update_priorities(priorities)
@@ -2,16 +2,43 @@
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Tuple
 
 from rich.console import Console
 from rich.table import Table
 
+from ..utils.compat import DATACLASS_SLOTS
+
+# Optional fast JSON backend for exports
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Initialize console
 console = Console()
 
 
-@dataclass
+def _first_key_in(keys: Tuple[str, ...], text: str) -> Optional[str]:
+    """
+    Find the first key, in table order, that occurs in a lowercased string.
+
+    Args:
+        keys: Lowercased table keys in priority order
+        text: Lowercased title, location or company
+
+    Returns:
+        Matching key or None
+    """
+    for key in keys:
+        if key in text:
+            return key
+    return None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SalaryData:
     """Salary data for a position."""
 
@@ -128,6 +155,18 @@ class SalaryResearch:
         "remote": 1.00,
     }
 
+    # Table keys in priority order; subclasses overriding a table get their own
+    _TITLE_KEYS = tuple(BASE_SALARY_RANGES)
+    _COMPANY_KEYS = tuple(COMPANY_MULTIPLIERS)
+    _LOCATION_KEYS = tuple(LOCATION_MULTIPLIERS)
+
+    def __init_subclass__(cls, **kwargs):
+        """Rebuild the table keys from the subclass's tables."""
+        super().__init_subclass__(**kwargs)
+        cls._TITLE_KEYS = tuple(cls.BASE_SALARY_RANGES)
+        cls._COMPANY_KEYS = tuple(cls.COMPANY_MULTIPLIERS)
+        cls._LOCATION_KEYS = tuple(cls.LOCATION_MULTIPLIERS)
+
     def __init__(self):
         """Initialize salary research tool."""
         pass
@@ -151,19 +190,59 @@ class SalaryResearch:
         Returns:
             SalaryData object with salary information
         """
-        # Normalize title
-        title_lower = title.lower()
+        (
+            min_salary,
+            max_salary,
+            median_salary,
+            bonus_min,
+            bonus_max,
+            equity_min,
+            equity_max,
+        ) = self._estimate(title.lower(), location.lower(), company.lower(), experience_level)
+
+        return SalaryData(
+            title=title,
+            location=location,
+            company=company,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            median_salary=median_salary,
+            bonus_min=bonus_min,
+            bonus_max=bonus_max,
+            equity_min=equity_min,
+            equity_max=equity_max,
+            data_points=100,  # Estimated
+            source="Market Estimates",
+        )
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _estimate(
+        cls,
+        title_lower: str,
+        location_lower: str,
+        company_lower: str,
+        experience_level: str,
+    ) -> Tuple[float, float, float, float, float, float, float]:
+        """
+        Estimate rounded salary figures for normalized inputs.
 
-        # Find matching title range
-        title_range = None
-        for key, ranges in self.BASE_SALARY_RANGES.items():
-            if key in title_lower:
-                title_range = ranges
-                break
+        Memoized because the figures depend only on these inputs, and batch
+        lookups repeat the same title, location and company combinations.
 
-        if title_range is None:
-            # Default to software engineer range
-            title_range = self.BASE_SALARY_RANGES["software engineer"]
+        Args:
+            title_lower: Lowercased job title
+            location_lower: Lowercased job location
+            company_lower: Lowercased company name
+            experience_level: entry, mid, senior, staff, principal
+
+        Returns:
+            Tuple of (min_salary, max_salary, median_salary, bonus_min, bonus_max,
+            equity_min, equity_max)
+        """
+        # Find matching title range, defaulting to software engineer
+        title_key = _first_key_in(cls._TITLE_KEYS, title_lower) or "software engineer"
+        title_range = cls.BASE_SALARY_RANGES[title_key]
 
         # Get base salary range
         if experience_level not in title_range:
@@ -173,24 +252,20 @@ class SalaryResearch:
 
         # Apply location multiplier
         location_mult = 1.0
-        if location:
-            location_lower = location.lower()
-            for loc, mult in self.LOCATION_MULTIPLIERS.items():
-                if loc in location_lower:
-                    location_mult = mult
-                    break
+        if location_lower:
+            loc = _first_key_in(cls._LOCATION_KEYS, location_lower)
+            if loc is not None:
+                location_mult = cls.LOCATION_MULTIPLIERS[loc]
 
         min_salary *= location_mult
         max_salary *= location_mult
 
         # Apply company multiplier
         company_mult = 1.0
-        if company:
-            company_lower = company.lower()
-            for comp, mult in self.COMPANY_MULTIPLIERS.items():
-                if comp in company_lower:
-                    company_mult = mult
-                    break
+        if company_lower:
+            comp = _first_key_in(cls._COMPANY_KEYS, company_lower)
+            if comp is not None:
+                company_mult = cls.COMPANY_MULTIPLIERS[comp]
 
         min_salary *= company_mult
         max_salary *= company_mult
@@ -207,19 +282,14 @@ class SalaryResearch:
         # Calculate median
         median_salary = (min_salary + max_salary) / 2
 
-        return SalaryData(
-            title=title,
-            location=location,
-            company=company,
-            min_salary=float(round(min_salary, -3)),
-            max_salary=float(round(max_salary, -3)),
-            median_salary=float(round(median_salary, -3)),
-            bonus_min=float(round(bonus_min, -3)),
-            bonus_max=float(round(bonus_max, -3)),
-            equity_min=float(round(equity_min, -3)),
-            equity_max=float(round(equity_max, -3)),
-            data_points=100,  # Estimated
-            source="Market Estimates",
+        return (
+            float(round(min_salary, -3)),
+            float(round(max_salary, -3)),
+            float(round(median_salary, -3)),
+            float(round(bonus_min, -3)),
+            float(round(bonus_max, -3)),
+            float(round(equity_min, -3)),
+            float(round(equity_max, -3)),
         )
 
     def print_salary_report(self, salary_data: SalaryData) -> None:
@@ -276,7 +346,8 @@ class SalaryResearch:
         )
 
     def export_json(self, salary_data: SalaryData, output_path: Path) -> None:
-        """Export salary data to JSON."""
+        """Export salary data to JSON, encoded with orjson when it is installed."""
+        total_min, total_max = salary_data.total_compensation()
         data = {
             "title": salary_data.title,
             "location": salary_data.location,
@@ -288,12 +359,15 @@ class SalaryResearch:
             "bonus_max": salary_data.bonus_max,
             "equity_min": salary_data.equity_min,
             "equity_max": salary_data.equity_max,
-            "total_compensation_min": salary_data.total_compensation()[0],
-            "total_compensation_max": salary_data.total_compensation()[1],
+            "total_compensation_min": total_min,
+            "total_compensation_max": total_max,
             "data_points": salary_data.data_points,
             "source": salary_data.source,
         }
-        output_path.write_text(json.dumps(data, indent=2))
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            output_path.write_text(json.dumps(data, indent=2))
 
 
 def research_salary(
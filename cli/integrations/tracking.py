@@ -1,9 +1,67 @@
 """Integration with CSV-based application tracking."""
 
 import csv
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import heapq
+import io
+import os
+from collections import Counter, defaultdict
+from datetime import date
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+# Tracking CSV columns, in file order
+_FIELDNAMES = (
+    "resume_version",
+    "company",
+    "role",
+    "date",
+    "status",
+    "response",
+    "notes",
+    "source",
+    "url",
+    "cover_letter",
+    "package_path",
+)
+
+# For writing entries as rows in column order
+_FIELD_SET = frozenset(_FIELDNAMES)
+_field_values = itemgetter(*_FIELDNAMES)
+
+# Statuses tallied per resume variant in the analytics
+_VARIANT_STATUSES = ("applied", "interview", "offer", "rejected")
+
+
+def _new_variant_tally() -> Dict[str, int]:
+    """Return an empty per-variant tally."""
+    return {"total": 0, "applied": 0, "interview": 0, "offer": 0, "rejected": 0, "responses": 0}
+
+
+def _new_company_group() -> Dict[str, Any]:
+    """Return an empty per-company group."""
+    return {
+        "total": 0,
+        "roles": {},
+        "latest": "",
+        "statuses": defaultdict(int),
+        "sources": {},
+        "has_response": False,
+    }
+
+
+def _add_to_company_group(group: Dict[str, Any], entry: Dict[str, Any], status: Any) -> None:
+    """Fold one entry into its per-company group."""
+    group["total"] += 1
+    # dict keys double as an insertion-ordered set
+    group["roles"][entry.get("role", "")] = None
+    group["sources"][entry.get("source", "")] = None
+    group["statuses"][status] += 1
+
+    entry_date = entry.get("date")
+    if entry_date and entry_date > group["latest"]:
+        group["latest"] = entry_date
+    if entry.get("response") == "1":
+        group["has_response"] = True
 
 
 class TrackingIntegration:
@@ -18,6 +76,15 @@ class TrackingIntegration:
         """
         self.config = config
         self.csv_path = config.tracking_csv_path
+        # Parsed rows and the (mtime_ns, size) of the file they were read from
+        self._entries_cache: Optional[List[Dict[str, str]]] = None
+        self._cache_stamp: Optional[Tuple[int, int]] = None
+        # Whether _write_csv would write the cached rows back byte-for-byte
+        self._cache_canonical = False
+        # Lowercased company -> row positions, for the entry list it was built from
+        self._company_index: Dict[str, List[int]] = {}
+        self._indexed_entries: Optional[List[Dict[str, str]]] = None
+        self._indexed_count = 0
 
     def log_application(
         self,
@@ -48,15 +115,12 @@ class TrackingIntegration:
         # Ensure CSV exists
         self._ensure_csv_exists()
 
-        # Read existing entries
-        entries = self._read_csv()
-
         # Add new entry
         entry = {
             "resume_version": variant,
             "company": company,
             "role": role,
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": date.today().isoformat(),
             "status": status,
             "response": "0",  # Will update if response received
             "notes": notes or "",
@@ -66,10 +130,57 @@ class TrackingIntegration:
             "package_path": package_path or "",
         }
 
-        entries.append(entry)
+        # Append the row in place; rewrite the whole file only when it can't be appended to
+        if not self._append_csv(entry):
+            entries = self._read_csv()
+            entries.append(entry)
+            self._write_csv(entries)
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of the CSV file, or None if it doesn't exist."""
+        try:
+            stat = self.csv_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _append_csv(self, entry: Dict[str, str]) -> bool:
+        """
+        Append a single entry to the CSV without rewriting it.
+
+        Only done when the file's header matches the current fieldnames and
+        the file ends with a newline, so the new row lines up with the rest.
 
-        # Write back
-        self._write_csv(entries)
+        Args:
+            entry: Entry with all fieldnames as keys
+
+        Returns:
+            True if appended, False if the file needs a full rewrite instead
+        """
+        stamp = self._file_stamp()
+
+        with open(self.csv_path, "rb") as f:
+            header = f.readline()
+            if not header.endswith(b"\n"):
+                return False
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                return False
+        if tuple(next(csv.reader([header.decode("utf-8", "replace")]), ())) != _FIELDNAMES:
+            return False
+
+        with open(self.csv_path, "a", newline="") as f:
+            csv.DictWriter(f, fieldnames=_FIELDNAMES).writerow(entry)
+
+        # Keep a fresh cache in step with the file rather than re-reading it
+        if self._entries_cache is not None and stamp == self._cache_stamp:
+            self._entries_cache.append(
+                {k: "" if entry[k] is None else str(entry[k]) for k in _FIELDNAMES}
+            )
+            self._cache_stamp = self._file_stamp()
+        else:
+            self._entries_cache = None
+        return True
 
     def _ensure_csv_exists(self) -> None:
         """Create CSV file with headers if it doesn't exist."""
@@ -77,45 +188,107 @@ class TrackingIntegration:
             self.csv_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(self.csv_path, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=self._get_fieldnames())
+                writer = csv.DictWriter(f, fieldnames=_FIELDNAMES)
                 writer.writeheader()
 
     def _get_fieldnames(self) -> list:
         """Get CSV field names."""
-        return [
-            "resume_version",
-            "company",
-            "role",
-            "date",
-            "status",
-            "response",
-            "notes",
-            "source",
-            "url",
-            "cover_letter",
-            "package_path",
-        ]
+        return list(_FIELDNAMES)
 
-    def _read_csv(self) -> list:
-        """Read all entries from CSV."""
-        entries: list[Any] = []
+    def _load_entries(self) -> List[Dict[str, str]]:
+        """
+        Return the cached entries, parsing the CSV again if it changed on disk.
 
-        if not self.csv_path.exists():
-            return entries
+        The returned list is shared with the cache and must not be mutated;
+        use _read_csv for entries that will be modified.
+        """
+        stamp = self._file_stamp()
+        if stamp is None:
+            return []
 
-        with open(self.csv_path, newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                entries.append(row)
+        if self._entries_cache is None or stamp != self._cache_stamp:
+            with open(self.csv_path, newline="") as f:
+                header, self._entries_cache, ragged = self._parse_rows(csv.reader(f))
+            self._cache_stamp = stamp
+            self._cache_canonical = not ragged and tuple(header) == _FIELDNAMES
 
-        return entries
+        return self._entries_cache
+
+    @staticmethod
+    def _parse_rows(reader) -> Tuple[List[str], List[Dict[str, Any]], bool]:
+        """
+        Build entry dicts from csv.reader rows, keyed by the header row.
+
+        Matches csv.DictReader (blank rows skipped, extra values under None,
+        missing values as None) without its per-row Python overhead.
+
+        Args:
+            reader: csv.reader over the tracking file
+
+        Returns:
+            Tuple of (header, entries, whether any row's width differed from the header)
+        """
+        header = next(reader, None)
+        if header is None:
+            return [], [], False
+
+        width = len(header)
+        entries = []
+        ragged = False
+        for row in reader:
+            if not row:
+                continue
+            entry = dict(zip(header, row))
+            if len(row) > width:
+                entry[None] = row[width:]
+                ragged = True
+            elif len(row) < width:
+                entry.update(dict.fromkeys(header[len(row) :]))
+                ragged = True
+            entries.append(entry)
+        return header, entries, ragged
+
+    def _read_csv(self) -> list:
+        """
+        Read all entries from CSV.
+
+        Parsed rows are cached until the file's mtime or size changes, and
+        callers get their own copies so they can mutate them freely.
+        """
+        return [dict(entry) for entry in self._load_entries()]
 
     def _write_csv(self, entries: list) -> None:
-        """Write entries to CSV."""
-        with open(self.csv_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self._get_fieldnames())
-            writer.writeheader()
-            writer.writerows(entries)
+        """
+        Write entries to CSV.
+
+        The rows are formatted in memory and written to a temporary file in one
+        call, which then replaces the CSV, so a failed write leaves it intact.
+        """
+        # Same rows csv.DictWriter would write: missing fields blank, unknown ones rejected
+        rows = []
+        for entry in entries:
+            if entry.keys() == _FIELD_SET:
+                rows.append(_field_values(entry))
+                continue
+            extra = entry.keys() - _FIELD_SET
+            if extra:
+                raise ValueError(
+                    "dict contains fields not in fieldnames: " + ", ".join(map(repr, extra))
+                )
+            rows.append([entry.get(field, "") for field in _FIELDNAMES])
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(_FIELDNAMES)
+        writer.writerows(rows)
+
+        tmp_path = self.csv_path.with_name(self.csv_path.name + ".tmp")
+        with open(tmp_path, "w", newline="") as f:
+            f.write(buffer.getvalue())
+        tmp_path.replace(self.csv_path)
+
+        # Entries may be partial rows, so let the next read parse the file again
+        self._entries_cache = None
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -124,30 +297,15 @@ class TrackingIntegration:
         Returns:
             Dictionary with statistics
         """
-        entries = self._read_csv()
-
-        total = len(entries)
-        if total == 0:
-            return {"total": 0, "applied": 0, "interview": 0, "offer": 0, "response_rate": 0.0}
+        entries = self._load_entries()
 
         # Count by status
-        status_counts = {}
-        for entry in entries:
-            status = entry.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = dict(Counter([entry.get("status", "unknown") for entry in entries]))
 
-        # Calculate response rate
-        responses = sum(1 for e in entries if e.get("response") == "1")
-        response_rate = (responses / total * 100) if total > 0 else 0
+        # Count responses
+        responses = [entry.get("response") for entry in entries].count("1")
 
-        return {
-            "total": total,
-            "applied": status_counts.get("applied", 0),
-            "interview": status_counts.get("interview", 0),
-            "offer": status_counts.get("offer", 0),
-            "response_rate": response_rate,
-            "by_status": status_counts,
-        }
+        return self._statistics_from_counts(len(entries), status_counts, responses)
 
     def get_recent_applications(self, limit: int = 10) -> list:
         """
@@ -159,10 +317,9 @@ class TrackingIntegration:
         Returns:
             List of application entries
         """
-        entries = self._read_csv()
-        # Sort by date descending
-        entries.sort(key=lambda e: e.get("date", ""), reverse=True)
-        return entries[:limit]
+        # Select the newest entries without sorting the rest; ties keep file order
+        entries = heapq.nlargest(limit, self._load_entries(), key=lambda e: e.get("date", ""))
+        return [dict(entry) for entry in entries]
 
     def update_status(self, company: str, new_status: str, role: Optional[str] = None) -> bool:
         """
@@ -176,25 +333,59 @@ class TrackingIntegration:
         Returns:
             True if updated, False if not found
         """
-        entries = self._read_csv()
-        updated = False
+        entries = self._load_entries()
+
+        for position in self._company_rows(entries, company.lower()):
+            entry = entries[position]
+            if role is None or entry.get("role", "").lower() == role.lower():
+                # Update a copy; the cached rows are shared
+                entry = dict(entry)
+                entry["status"] = new_status
+
+                # Mark as response if moving from applied
+                if new_status in ["interview", "offer", "rejected"]:
+                    entry["response"] = "1"
+
+                rows = list(entries)
+                rows[position] = entry
+                self._write_csv(rows)
+
+                if self._cache_canonical and isinstance(new_status, str):
+                    # The file now holds exactly these rows, in the same positions,
+                    # so keep them and the company index for the next update
+                    self._entries_cache = rows
+                    self._cache_stamp = self._file_stamp()
+                    self._indexed_entries = rows
+                return True
+
+        return False
+
+    def _company_rows(self, entries: List[Dict[str, str]], company_lower: str) -> List[int]:
+        """
+        Find the positions of entries for a company, in file order.
 
-        for entry in entries:
-            if entry["company"].lower() == company.lower():
-                if role is None or entry.get("role", "").lower() == role.lower():
-                    entry["status"] = new_status
+        The index is built once per parsed entry list and extended with rows
+        appended to it since, instead of scanning every entry on each update.
 
-                    # Mark as response if moving from applied
-                    if new_status in ["interview", "offer", "rejected"]:
-                        entry["response"] = "1"
+        Args:
+            entries: Cached entries from _load_entries
+            company_lower: Lowercased company name
 
-                    updated = True
-                    break
+        Returns:
+            Positions of matching entries
+        """
+        if self._indexed_entries is not entries:
+            self._company_index = {}
+            self._indexed_entries = entries
+            self._indexed_count = 0
 
-        if updated:
-            self._write_csv(entries)
+        index = self._company_index
+        for position in range(self._indexed_count, len(entries)):
+            key = (entries[position].get("company") or "").lower()
+            index.setdefault(key, []).append(position)
+        self._indexed_count = len(entries)
 
-        return updated
+        return index.get(company_lower, [])
 
     # =========================================================================
     # Analytics Methods for Dashboard
@@ -207,14 +398,8 @@ class TrackingIntegration:
         Returns:
             Dictionary mapping status to count
         """
-        entries = self._read_csv()
-        status_counts = defaultdict(int)
-
-        for entry in entries:
-            status = entry.get("status", "unknown")
-            status_counts[status] += 1
-
-        return dict(status_counts)
+        entries = self._load_entries()
+        return dict(Counter([entry.get("status", "unknown") for entry in entries]))
 
     def get_applications_timeline(self, days: int = 90) -> List[Dict[str, Any]]:
         """
@@ -226,28 +411,10 @@ class TrackingIntegration:
         Returns:
             List of dicts with 'date' and 'count' keys
         """
-        entries = self._read_csv()
-        cutoff_date = datetime.now() - timedelta(days=days)
-
-        # Count applications per date
-        date_counts = defaultdict(int)
-        for entry in entries:
-            try:
-                entry_date = datetime.strptime(entry.get("date", ""), "%Y-%m-%d")
-                if entry_date >= cutoff_date:
-                    date_counts[entry.get("date", "")] += 1
-            except (ValueError, TypeError):
-                continue
-
-        # Generate timeline with all dates in range
-        timeline = []
-        current_date = cutoff_date
-        while current_date <= datetime.now():
-            date_str = current_date.strftime("%Y-%m-%d")
-            timeline.append({"date": date_str, "count": date_counts.get(date_str, 0)})
-            current_date += timedelta(days=1)
-
-        return timeline
+        entries = self._load_entries()
+        return self._timeline_from_counts(
+            Counter([entry.get("date", "") for entry in entries]), days
+        )
 
     def get_variant_performance(self) -> List[Dict[str, Any]]:
         """
@@ -256,60 +423,22 @@ class TrackingIntegration:
         Returns:
             List of dicts with variant performance data
         """
-        entries = self._read_csv()
+        entries = self._load_entries()
 
         # Group by variant
-        variant_data = defaultdict(
-            lambda: {
-                "total": 0,
-                "applied": 0,
-                "interview": 0,
-                "offer": 0,
-                "rejected": 0,
-                "responses": 0,
-            }
-        )
+        variant_data = defaultdict(_new_variant_tally)
 
         for entry in entries:
-            variant = entry.get("resume_version", "unknown")
             status = entry.get("status", "unknown")
-            response = entry.get("response", "0")
-
-            variant_data[variant]["total"] += 1
-
-            if status == "applied":
-                variant_data[variant]["applied"] += 1
-            elif status == "interview":
-                variant_data[variant]["interview"] += 1
-            elif status == "offer":
-                variant_data[variant]["offer"] += 1
-            elif status == "rejected":
-                variant_data[variant]["rejected"] += 1
-
-            if response == "1":
-                variant_data[variant]["responses"] += 1
+            data = variant_data[entry.get("resume_version", "unknown")]
 
-        # Calculate rates
-        result = []
-        for variant, data in variant_data.items():
-            total = data["total"]
-            result.append(
-                {
-                    "variant": variant,
-                    "total_applications": total,
-                    "response_rate": (data["responses"] / total * 100) if total > 0 else 0,
-                    "interview_rate": (data["interview"] / total * 100) if total > 0 else 0,
-                    "offer_rate": (data["offer"] / total * 100) if total > 0 else 0,
-                    "rejection_rate": (data["rejected"] / total * 100) if total > 0 else 0,
-                    "interviews": data["interview"],
-                    "offers": data["offer"],
-                    "rejected": data["rejected"],
-                }
-            )
+            data["total"] += 1
+            if status in _VARIANT_STATUSES:
+                data[status] += 1
+            if entry.get("response", "0") == "1":
+                data["responses"] += 1
 
-        # Sort by total applications descending
-        result.sort(key=lambda x: x["total_applications"], reverse=True)
-        return result
+        return self._variant_rows(variant_data)
 
     def get_company_analytics(self) -> List[Dict[str, Any]]:
         """
@@ -318,56 +447,31 @@ class TrackingIntegration:
         Returns:
             List of dicts with company data
         """
-        entries = self._read_csv()
+        entries = self._load_entries()
 
         # Group by company
-        company_data = defaultdict(lambda: {"applications": [], "statuses": defaultdict(int)})
+        company_data = defaultdict(_new_company_group)
 
         for entry in entries:
-            company = entry.get("company", "Unknown")
-            status = entry.get("status", "unknown")
-            company_data[company]["applications"].append(entry)
-            company_data[company]["statuses"][status] += 1
-
-        result = []
-        for company, data in company_data.items():
-            apps = data["applications"]
-            statuses = data["statuses"]
-
-            # Get unique roles
-            roles = list(set(app.get("role", "") for app in apps))
-
-            # Get latest application date
-            dates = [app.get("date", "") for app in apps if app.get("date")]
-            latest_date = max(dates) if dates else ""
-
-            # Get sources
-            sources = list(set(app.get("source", "") for app in apps))
-
-            result.append(
-                {
-                    "company": company,
-                    "total_applications": len(apps),
-                    "roles": roles,
-                    "latest_application": latest_date,
-                    "statuses": dict(statuses),
-                    "sources": sources,
-                    "has_response": any(app.get("response") == "1" for app in apps),
-                }
+            _add_to_company_group(
+                company_data[entry.get("company", "Unknown")], entry, entry.get("status", "unknown")
             )
 
-        # Sort by total applications descending
-        result.sort(key=lambda x: x["total_applications"], reverse=True)
-        return result
+        return self._company_summaries(company_data)
 
-    def get_response_rate_gauge(self) -> Dict[str, Any]:
+    def get_response_rate_gauge(self, stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get overall response rate for gauge display.
 
+        Args:
+            stats: Output of get_statistics, if already computed
+
         Returns:
             Dict with response_rate, interviews, offers, total
         """
-        stats = self.get_statistics()
+        if stats is None:
+            stats = self.get_statistics()
+
         return {
             "response_rate": stats.get("response_rate", 0),
             "interview_rate": (
@@ -392,21 +496,16 @@ class TrackingIntegration:
         Returns:
             List of dicts with source and count
         """
-        entries = self._read_csv()
-        source_counts = defaultdict(int)
-
-        for entry in entries:
-            source = entry.get("source", "unknown")
-            source_counts[source] += 1
-
-        result = [{"source": source, "count": count} for source, count in source_counts.items()]
-        result.sort(key=lambda x: x["count"], reverse=True)
-        return result
+        entries = self._load_entries()
+        return self._source_rows(Counter([entry.get("source", "unknown") for entry in entries]))
 
     def get_dashboard_data(self) -> Dict[str, Any]:
         """
         Get comprehensive dashboard data for analytics.
 
+        Status, variant and company tallies share a single pass over the
+        entries; the flat source and date counts are taken with Counter.
+
         Returns:
             Dictionary with dashboard data including:
             - overview: response_rate, interview_rate, offer_rate, total_applications, interviews, offers
@@ -416,11 +515,120 @@ class TrackingIntegration:
             - company_analytics: analytics grouped by company
             - source_breakdown: breakdown by application source
         """
+        entries = self._load_entries()
+
+        status_counts = defaultdict(int)
+        variant_data = defaultdict(_new_variant_tally)
+        company_data = defaultdict(_new_company_group)
+        responses = 0
+
+        for entry in entries:
+            status = entry.get("status", "unknown")
+            responded = entry.get("response") == "1"
+
+            status_counts[status] += 1
+            responses += responded
+
+            variant = variant_data[entry.get("resume_version", "unknown")]
+            variant["total"] += 1
+            if status in _VARIANT_STATUSES:
+                variant[status] += 1
+            variant["responses"] += responded
+
+            _add_to_company_group(company_data[entry.get("company", "Unknown")], entry, status)
+
+        source_counts = Counter([entry.get("source", "unknown") for entry in entries])
+        date_counts = Counter([entry.get("date", "") for entry in entries])
+
+        stats = self._statistics_from_counts(len(entries), dict(status_counts), responses)
         return {
-            "overview": self.get_response_rate_gauge(),
-            "by_status": self.get_applications_by_status(),
-            "timeline": self.get_applications_timeline(days=90),
-            "variant_performance": self.get_variant_performance(),
-            "company_analytics": self.get_company_analytics(),
-            "source_breakdown": self.get_source_breakdown(),
+            "overview": self.get_response_rate_gauge(stats),
+            "by_status": dict(status_counts),
+            "timeline": self._timeline_from_counts(date_counts, days=90),
+            "variant_performance": self._variant_rows(variant_data),
+            "company_analytics": self._company_summaries(company_data),
+            "source_breakdown": self._source_rows(source_counts),
         }
+
+    # Shared finalizers: turn per-key tallies into the analytics result shapes
+
+    @staticmethod
+    def _statistics_from_counts(
+        total: int, status_counts: Dict[str, int], responses: int
+    ) -> Dict[str, Any]:
+        """Build the get_statistics result from status counts and a response tally."""
+        if total == 0:
+            return {"total": 0, "applied": 0, "interview": 0, "offer": 0, "response_rate": 0.0}
+
+        return {
+            "total": total,
+            "applied": status_counts.get("applied", 0),
+            "interview": status_counts.get("interview", 0),
+            "offer": status_counts.get("offer", 0),
+            "response_rate": responses / total * 100,
+            "by_status": status_counts,
+        }
+
+    @staticmethod
+    def _timeline_from_counts(date_counts: Dict[Any, int], days: int) -> List[Dict[str, Any]]:
+        """Build the daily timeline from counts keyed by the raw date column."""
+        end_ordinal = date.today().toordinal()
+        day_strs = [
+            date.fromordinal(ordinal).isoformat()
+            for ordinal in range(end_ordinal - days, end_ordinal + 1)
+        ]
+
+        # Only canonical YYYY-MM-DD strings can match a day in range, so each
+        # day is looked up directly instead of parsing every stored date
+        return [{"date": date_str, "count": date_counts.get(date_str, 0)} for date_str in day_strs]
+
+    @staticmethod
+    def _variant_rows(variant_data: Dict[str, Dict[str, int]]) -> List[Dict[str, Any]]:
+        """Build the get_variant_performance result from per-variant tallies."""
+        result = []
+        for variant, data in variant_data.items():
+            total = data["total"]
+            result.append(
+                {
+                    "variant": variant,
+                    "total_applications": total,
+                    "response_rate": (data["responses"] / total * 100) if total > 0 else 0,
+                    "interview_rate": (data["interview"] / total * 100) if total > 0 else 0,
+                    "offer_rate": (data["offer"] / total * 100) if total > 0 else 0,
+                    "rejection_rate": (data["rejected"] / total * 100) if total > 0 else 0,
+                    "interviews": data["interview"],
+                    "offers": data["offer"],
+                    "rejected": data["rejected"],
+                }
+            )
+
+        # Sort by total applications descending
+        result.sort(key=lambda x: x["total_applications"], reverse=True)
+        return result
+
+    @staticmethod
+    def _company_summaries(company_data: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build the get_company_analytics result from per-company groups."""
+        result = [
+            {
+                "company": company,
+                "total_applications": data["total"],
+                "roles": list(data["roles"]),
+                "latest_application": data["latest"],
+                "statuses": dict(data["statuses"]),
+                "sources": list(data["sources"]),
+                "has_response": data["has_response"],
+            }
+            for company, data in company_data.items()
+        ]
+
+        # Sort by total applications descending
+        result.sort(key=lambda x: x["total_applications"], reverse=True)
+        return result
+
+    @staticmethod
+    def _source_rows(source_counts: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Build the get_source_breakdown result from per-source counts."""
+        result = [{"source": source, "count": count} for source, count in source_counts.items()]
+        result.sort(key=lambda x: x["count"], reverse=True)
+        return result
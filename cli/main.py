@@ -4,7 +4,9 @@ Resume CLI System
 A unified command-line interface for generating and managing job-specific resumes.
 """
 
+import re
 import sys
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -12,7 +14,7 @@ import click
 
 from . import __version__
 from .utils.config import Config
-from .utils.lazy import LazyConsole
+from .utils.lazy import LazyConsole, LazyGroup
 from .utils.yaml_parser import ResumeYAML
 
 # Initialize rich console
@@ -22,8 +24,32 @@ console = LazyConsole()
 DEFAULT_YAML_PATH = Path(__file__).parent.parent / "resume.yaml"
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "config" / "default.yaml"
 
-
-@click.group()
+# Company name -> package directory slug
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASHES = re.compile(r"[-\s]+")
+
+# Commands defined in cli/commands, imported only when invoked or listed
+LAZY_SUBCOMMANDS = {
+    # LinkedIn commands
+    "linkedin-import": "cli.commands.linkedin:linkedin_import",
+    "linkedin-export": "cli.commands.linkedin:linkedin_export",
+    # Tutorial command
+    "tutorial": "cli.commands.tutorials:tutorial",
+    # Template marketplace commands
+    "templates": "cli.commands.templates:templates",
+    # Convert commands for JSON Resume interoperability
+    "convert": "cli.commands.convert:convert",
+    "import-json-resume": "cli.commands.convert:import_json_resume",
+    "export-json-resume": "cli.commands.convert:export_json_resume",
+    # New import/export commands per Issue #118
+    "import": "cli.commands.convert:import_resume",
+    "export": "cli.commands.convert:export_resume",
+    # Preview command
+    "preview": "cli.commands.preview:preview",
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.version_option(version=__version__)
 @click.option(
     "--yaml-path",
@@ -48,7 +74,7 @@ def cli(ctx, yaml_path: str, config_path: str):
     ctx.ensure_object(dict)
 
     # Load config
-    config = Config(Path(config_path) if Path(config_path).exists() else None)
+    config = Config(Path(config_path))
 
     # Store in context
     ctx.obj["yaml_path"] = Path(yaml_path)
@@ -224,9 +250,7 @@ def generate(
 
             # Determine output path
             if output_path is None and not no_save:
-                base_path = TemplateGenerator(yaml_path, config=config).get_output_path(
-                    variant, format
-                )
+                base_path = multi_lang_gen.template_generator.get_output_path(variant, format)
                 stem = base_path.stem
                 output_path = base_path.parent / f"{stem}-{language}{base_path.suffix}"
 
@@ -241,9 +265,7 @@ def generate(
 
             if output_path is None and not no_save:
                 # Add -ai suffix to filename
-                base_path = TemplateGenerator(yaml_path, config=config).get_output_path(
-                    variant, format
-                )
+                base_path = ai_gen.template_generator.get_output_path(variant, format)
                 stem = base_path.stem
                 output_path = base_path.parent / f"{stem}-ai{base_path.suffix}"
 
@@ -349,9 +371,6 @@ def generate_package(
         resume-cli generate-package --job-desc job.txt --company "Acme Corp" --non-interactive
         resume-cli generate-package --job-desc job.txt --variant v1.2.0-ml_ai
     """
-    import re
-    from datetime import datetime
-
     yaml_path = ctx.obj["yaml_path"]
     config = ctx.obj["config"]
 
@@ -395,8 +414,8 @@ def generate_package(
 
         # Create package directory
         date_str = datetime.now().strftime("%Y-%m-%d")
-        company_slug = re.sub(r"[^\w\s-]", "", company_name).strip().lower()[:30]
-        company_slug = re.sub(r"[-\s]+", "-", company_slug)
+        company_slug = _SLUG_STRIP.sub("", company_name).strip().lower()[:30]
+        company_slug = _SLUG_DASHES.sub("-", company_slug)
         package_dir = output_base_dir / f"{company_slug}-{date_str}"
         package_dir.mkdir(parents=True, exist_ok=True)
 
@@ -1023,8 +1042,6 @@ def _print_timeline_summary(console, dashboard_data: dict, days: int = 90):
     console.print(f"\n[bold]📈 Application Timeline (Last {days} Days)[/bold]\n")
 
     # Aggregate by week
-    from datetime import datetime
-
     weekly_counts: dict[str, int] = {}
     for entry in timeline:
         try:
@@ -1057,44 +1074,6 @@ def _print_timeline_summary(console, dashboard_data: dict, days: int = 90):
     console.print(f"\n  [dim]Total applications in period: {total_in_period}[/dim]")
 
 
-# Add LinkedIn commands
-from .commands.linkedin import linkedin_export, linkedin_import
-
-cli.add_command(linkedin_import)
-cli.add_command(linkedin_export)
-
-# Add tutorial command
-from .commands.tutorials import tutorial as tutorial_group
-
-cli.add_command(tutorial_group, name="tutorial")
-
-# Add template marketplace commands
-from .commands.templates import templates as templates_group
-
-cli.add_command(templates_group, name="templates")
-
-# Add convert commands for JSON Resume interoperability
-from .commands.convert import (
-    convert,
-    export_json_resume,
-    export_resume,
-    import_json_resume,
-    import_resume,
-)
-
-cli.add_command(convert)
-cli.add_command(import_json_resume, name="import-json-resume")
-cli.add_command(export_json_resume, name="export-json-resume")
-# New import/export commands per Issue #118
-cli.add_command(import_resume, name="import")
-cli.add_command(export_resume, name="export")
-
-# Add preview command
-from .commands.preview import preview
-
-cli.add_command(preview)
-
-
 @cli.command("ats-check")
 @click.option("-v", "--variant", default="v1.0.0-base", help="Resume variant to check")
 @click.option(
@@ -1543,7 +1522,18 @@ def mock_interview(
 @click.option("--url", type=str, help="URL to job posting")
 @click.option("-o", "--output", type=click.Path(), help="Save parsed data as JSON")
 @click.option("--no-cache", is_flag=True, help="Disable caching of parsed job postings")
-def job_parse(file_input: Optional[str], url: Optional[str], output: Optional[str], no_cache: bool):
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-fetch a cached --url posting, reusing the cache if it is unchanged",
+)
+def job_parse(
+    file_input: Optional[str],
+    url: Optional[str],
+    output: Optional[str],
+    no_cache: bool,
+    refresh: bool,
+):
     """
     Parse job posting from LinkedIn, Indeed, or other sources.
 
@@ -1554,6 +1544,7 @@ def job_parse(file_input: Optional[str], url: Optional[str], output: Optional[st
         resume-cli job-parse --url https://linkedin.com/jobs/view/12345
         resume-cli job-parse --file job-posting.html
         resume-cli job-parse --url URL --output job-data.json
+        resume-cli job-parse --url URL --refresh
     """
     console.print("[bold blue]Parsing Job Posting[/bold blue]")
 
@@ -1574,7 +1565,7 @@ def job_parse(file_input: Optional[str], url: Optional[str], output: Optional[st
             job_details = parser.parse_from_file(Path(file_input), url=url)
         elif url:
             console.print(f"  URL: {url}")
-            job_details = parser.parse_from_url(url)
+            job_details = parser.parse_from_url(url, refresh=refresh)
 
         # Display results
         console.print("\n[bold green]Parsed Job Details:[/bold green]\n")
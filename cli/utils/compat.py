@@ -0,0 +1,7 @@
+"""Compatibility helpers for older Python versions."""
+
+import sys
+from typing import Dict
+
+# __slots__ for dataclasses needs Python 3.10+; older versions keep a per-instance __dict__
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
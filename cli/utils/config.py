@@ -67,15 +67,19 @@ class Config:
         self.config_path = config_path
         self._config: Dict[str, Any] = deepcopy(self.DEFAULT_CONFIG)
 
-        if config_path and config_path.exists():
-            self.load(config_path)
+        if config_path:
+            try:
+                self.load(config_path)
+            except FileNotFoundError:
+                pass
 
     def load(self, config_path: Path) -> None:
         """Load configuration from file."""
         import yaml
 
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with open(config_path) as f:
-            user_config = yaml.safe_load(f) or {}
+            user_config = yaml.load(f, Loader=loader) or {}
             self._merge_config(user_config)
 
     def _merge_config(self, user_config: Dict[str, Any]) -> None:
@@ -1,6 +1,9 @@
 """Lazy loading utilities for CLI performance."""
 
-from typing import Any
+import importlib
+from typing import Any, Dict, List, Optional
+
+import click
 
 
 class LazyConsole:
@@ -23,3 +26,35 @@ class LazyConsole:
     def __getattr__(self, name: str) -> Any:
         """Proxy attribute access to the underlying Console."""
         return getattr(self.console, name)
+
+
+class LazyGroup(click.Group):
+    """Click group that imports some subcommands only when they are looked up."""
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        """
+        Initialize lazy group.
+
+        Args:
+            lazy_subcommands: Mapping of command name to "module.path:attribute"
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eager and lazy command names together, sorted."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a command, importing its module first if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import and return a lazy command."""
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy command {cmd_name!r} is not a click command: {command!r}")
+        return command
@@ -37,15 +37,19 @@ class ResumeYAML:
             FileNotFoundError: If resume.yaml doesn't exist
             yaml.YAMLError: If YAML is malformed
         """
-        if not self.yaml_path.exists():
+        try:
+            f = open(self.yaml_path, encoding="utf-8")
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Resume file not found: {self.yaml_path}\n" f"Run 'resume-cli init' to create it."
-            )
+            ) from None
 
         import yaml
 
-        with open(self.yaml_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        # libyaml's C loader when PyYAML was built with it; same results as safe_load
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with f:
+            data = yaml.load(f, Loader=loader)
             self._data = data if isinstance(data, dict) else {}
 
         return self._data
@@ -2,10 +2,11 @@
 
 from unittest.mock import patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from cli.main import cli
+from cli.main import LAZY_SUBCOMMANDS, cli, job_parse
 
 # Sample minimal resume.yaml for testing - must have all required fields
 SAMPLE_YAML_CONTENT = """\
@@ -461,6 +462,15 @@ class TestCLIJobParse:
         # Should complete (parsing may not find data but shouldn't crash)
         assert "Error" not in result.output or result.exit_code == 0
 
+    def test_job_parse_refresh_passed_to_parser(self, runner):
+        """Test --refresh revalidates a cached URL posting."""
+        with patch("cli.integrations.job_parser.JobParser.parse_from_url") as mock_parse:
+            mock_parse.return_value.company = "Test Corp"
+            result = runner.invoke(job_parse, ["--url", "https://example.com/job", "--refresh"])
+
+        assert result.exit_code == 0
+        mock_parse.assert_called_once_with("https://example.com/job", refresh=True)
+
 
 class TestCLIHelp:
     """Tests for CLI help."""
@@ -489,6 +499,15 @@ class TestCLIHelp:
         assert result.exit_code == 0
         # Should show version
 
+    def test_lazy_commands_listed_and_loadable(self, runner):
+        """Test lazily imported commands appear in help and resolve to click commands."""
+        result = runner.invoke(cli, ["--help"], catch_exceptions=False)
+
+        for name in LAZY_SUBCOMMANDS:
+            assert name in result.output
+            with click.Context(cli) as ctx:
+                assert isinstance(cli.get_command(ctx, name), click.Command)
+
 
 class TestCLIErrorHandling:
     """Tests for CLI error handling."""
@@ -6,9 +6,13 @@ Tests the job posting parser with realistic HTML samples from
 LinkedIn, Indeed, and generic job boards.
 """
 
+import gzip
 import json
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -498,6 +502,35 @@ class TestRemoteDetection:
 
         assert job.remote is True  # Hybrid is considered remote-friendly
 
+    def test_remote_detection_onsite(self):
+        """Test that on-site only postings are detected as not remote."""
+        parser = JobParser()
+        assert parser._detect_remote_status("This role is On-Site in Austin, TX") is False
+
+    def test_remote_detection_remote_wins_over_onsite(self):
+        """Test that any remote keyword outweighs on-site indicators."""
+        parser = JobParser()
+        text = "Onsite two days a week, otherwise Work From Home"
+        assert parser._detect_remote_status(text) is True
+
+    def test_remote_detection_across_multiple_texts(self):
+        """Test that keywords in any of several texts are detected."""
+        parser = JobParser()
+        assert parser._detect_remote_status("<html>On-site</html>", "Fully remote team") is True
+        assert parser._detect_remote_status("<html>On-site</html>", None) is False
+        assert parser._detect_remote_status("", None) is None
+
+    def test_quick_check_covers_every_keyword(self):
+        """Test that the quick-reject substrings never skip a real keyword."""
+        keywords = JobParser.REMOTE_KEYWORDS + JobParser.HYBRID_KEYWORDS + JobParser.ONSITE_KEYWORDS
+        for keyword in keywords:
+            assert any(quick in keyword for quick in JobParser._REMOTE_QUICK_CHECK), keyword
+
+    def test_remote_detection_unclear(self):
+        """Test that postings without any indicator return None."""
+        parser = JobParser()
+        assert parser._detect_remote_status("Senior engineer, competitive salary") is None
+
 
 class TestCacheOperations:
     """Test cache operations."""
@@ -528,6 +561,41 @@ class TestCacheOperations:
         result = parser._get_from_cache("nonexistent_key")
         assert result is None
 
+    def test_cache_written_compressed(self, tmp_path):
+        """Test that cache entries are stored as gzip-compressed JSON."""
+        parser = JobParser(cache_dir=tmp_path)
+        parser._save_to_cache("gz_key", JobDetails(company="Gzip Co"))
+
+        cache_file = tmp_path / "gz_key.json.gz"
+        assert cache_file.exists()
+        assert json.loads(gzip.decompress(cache_file.read_bytes()))["company"] == "Gzip Co"
+
+    def test_cache_reads_legacy_json(self, tmp_path):
+        """Test that uncompressed entries from older versions are still read."""
+        parser = JobParser(cache_dir=tmp_path)
+        (tmp_path / "legacy.json").write_text(JobDetails(company="Legacy Co").to_json())
+
+        retrieved = parser._get_from_cache("legacy")
+        assert retrieved is not None
+        assert retrieved.company == "Legacy Co"
+
+    def test_cache_corrupt_file_returns_none(self, tmp_path):
+        """Test that an unreadable cache entry is treated as a miss."""
+        parser = JobParser(cache_dir=tmp_path)
+        (tmp_path / "broken.json").write_bytes(b"{not valid json")
+        assert parser._get_from_cache("broken") is None
+
+    def test_cache_round_trips_unicode(self, tmp_path):
+        """Test that non-ASCII values survive a cache round trip."""
+        parser = JobParser(cache_dir=tmp_path)
+        job = JobDetails(company="Café Société", position="Ingénieur", salary="€80k")
+
+        parser._save_to_cache("unicode", job)
+        retrieved = parser._get_from_cache("unicode")
+
+        assert retrieved.company == "Café Société"
+        assert retrieved.salary == "€80k"
+
     def test_clear_cache(self, tmp_path):
         """Test clearing cache."""
         parser = JobParser(cache_dir=tmp_path)
@@ -542,8 +610,23 @@ class TestCacheOperations:
             )
             parser._save_to_cache(f"key_{i}", job)
 
+        (tmp_path / "key_0.meta").write_text('{"etag": "abc"}')
+
         cleared = parser.clear_cache()
         assert cleared == 3
+        assert not list(tmp_path.iterdir())
+
+    def test_clear_cache_removes_legacy_and_keeps_other_files(self, tmp_path):
+        """Test clearing cache handles legacy entries and ignores unrelated files."""
+        parser = JobParser(cache_dir=tmp_path)
+        parser._save_to_cache("new", JobDetails(company="New"))
+        (tmp_path / "old.json").write_text("{}")
+        (tmp_path / "notes.txt").write_text("keep me")
+        (tmp_path / "subdir.json").mkdir()
+
+        assert parser.clear_cache() == 2
+        assert (tmp_path / "notes.txt").exists()
+        assert (tmp_path / "subdir.json").is_dir()
 
     def test_url_caching(self, tmp_path):
         """Test that URL parsing uses cache."""
@@ -564,6 +647,39 @@ class TestCacheOperations:
         job = parser.parse_from_url(url)
         assert job.company == "Cached Company"
 
+    def test_url_fetch_uses_pooled_session_and_stores_etag(self, tmp_path):
+        """Test that fetching reuses one session and records the ETag."""
+        parser = JobParser(cache_dir=tmp_path)
+        response = MagicMock(status_code=200, text=GENERIC_SAMPLE_HTML, headers={"ETag": '"v1"'})
+        session = MagicMock()
+        session.get.return_value = response
+        parser._session = session
+
+        job = parser.parse_from_url("https://example.com/job/etag")
+
+        assert job.url == "https://example.com/job/etag"
+        assert parser._get_session() is session
+        cache_key = parser._get_cache_key("https://example.com/job/etag")
+        assert parser._get_cache_validators(cache_key) == {"etag": '"v1"', "last_modified": None}
+
+    def test_url_refresh_sends_conditional_request(self, tmp_path):
+        """Test that refresh revalidates with If-None-Match and reuses cache on 304."""
+        parser = JobParser(cache_dir=tmp_path)
+        url = "https://example.com/job/refresh"
+        cache_key = parser._get_cache_key(url)
+        parser._save_to_cache(cache_key, JobDetails(company="Cached Company"))
+        parser._save_cache_validators(cache_key, {"ETag": '"v1"'})
+
+        session = MagicMock()
+        session.get.return_value = MagicMock(status_code=304)
+        parser._session = session
+
+        job = parser.parse_from_url(url, refresh=True)
+
+        assert job.company == "Cached Company"
+        sent_headers = session.get.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"v1"'
+
 
 class TestParseJobPostingFunction:
     """Test the parse_job_posting convenience function."""
@@ -605,6 +721,24 @@ class TestParseJobPostingFunction:
         assert job.company is not None
 
 
+class TestLazyImports:
+    """Test that heavy optional imports are deferred until needed."""
+
+    def test_module_import_does_not_load_bs4_or_requests(self):
+        """Test importing the parser module leaves bs4 and requests unloaded."""
+        code = (
+            "import sys, cli.integrations.job_parser; "
+            "print('bs4' in sys.modules, 'requests' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent,
+        )
+        assert result.stdout.strip() == "False False"
+
+
 class TestSourceDetection:
     """Test automatic source detection."""
 
@@ -666,6 +800,32 @@ class TestSalaryExtraction:
         assert salary is None
 
 
+class TestSectionExtraction:
+    """Test requirements/responsibilities section splitting."""
+
+    def test_responsibilities_end_at_benefits(self):
+        """Test that responsibilities stop at the next end-of-list header."""
+        description = (
+            "Responsibilities:\n- Design scalable services\n- Review pull requests\n"
+            "Benefits:\n- Unlimited paid time off\n"
+            "Requirements:\n- Five years of Python\n"
+        )
+        parser = JobParser()
+        requirements, responsibilities = parser._extract_sections_from_description(description)
+        assert responsibilities == ["Design scalable services", "Review pull requests"]
+        assert requirements == ["Five years of Python"]
+
+    def test_adjacent_headers_are_both_found(self):
+        """Test that a header directly after another is still detected."""
+        description = (
+            "Requirements\n- Strong SQL skills\nResponsibilities\n- Maintain data pipelines\n"
+        )
+        parser = JobParser()
+        requirements, responsibilities = parser._extract_sections_from_description(description)
+        assert requirements == ["Strong SQL skills"]
+        assert responsibilities == ["Maintain data pipelines"]
+
+
 class TestExperienceLevelExtraction:
     """Test experience level extraction."""
 
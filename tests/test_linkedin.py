@@ -1,12 +1,22 @@
 """Tests for LinkedIn integration."""
 
 import json
+import re
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import yaml
 
-from cli.integrations.linkedin import LinkedInSync
+from cli.integrations.linkedin import LinkedInSync, _keyword_trie_pattern
+
+try:
+    import ijson  # noqa: F401
+
+    ijson_available = True
+except ImportError:
+    ijson_available = False
 
 
 class MockConfig:
@@ -16,6 +26,13 @@ class MockConfig:
         return default
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Keep the default LinkedIn import cache out of the user's home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+
+
 @pytest.fixture
 def mock_config():
     """Return a mock config object."""
@@ -169,6 +186,16 @@ class TestLinkedInSync:
         assert contact["location"]["city"] == "San Francisco"
         assert contact["location"]["state"] == "California"
 
+    def test_extract_contact_websites(self, mock_config):
+        """Test that up to three comma-separated websites become contact URLs."""
+        sync = LinkedInSync(mock_config)
+
+        contact = sync._extract_contact(
+            {"profile": [{"Websites": "a.dev, , b.dev,c.dev, d.dev"}]},
+        )
+
+        assert contact["urls"] == {"website": "a.dev", "website_2": "b.dev", "website_3": "c.dev"}
+
     def test_extract_summary(self, mock_config, sample_linkedin_data):
         """Test summary extraction."""
         sync = LinkedInSync(mock_config)
@@ -177,6 +204,15 @@ class TestLinkedInSync:
         assert summary["base"] == "Experienced software engineer with 10+ years of experience."
         assert "variants" in summary
 
+    def test_normalize_profile_unwraps_csv_rows(self, mock_config):
+        """Test that folder-export profile rows resolve to the first row."""
+        sync = LinkedInSync(mock_config)
+        row = {"First Name": "Jane", "Last Name": "Roe"}
+
+        assert sync._normalize_profile({"profile": [row]}) is row
+        assert sync._normalize_profile({"Profile": row}) is row
+        assert sync._normalize_profile(row) is row
+
     def test_extract_skills(self, mock_config, sample_linkedin_data):
         """Test skills extraction and categorization."""
         sync = LinkedInSync(mock_config)
@@ -225,6 +261,54 @@ class TestLinkedInSync:
         assert certifications[0]["name"] == "AWS Certified Solutions Architect"
         assert certifications[0]["issuer"] == "Amazon Web Services"
 
+    def test_first_returns_first_truthy_alias(self, mock_config):
+        """Test alias lookup skips empty values and falls back to an empty string."""
+        data = {"company": "", "CompanyName": None, "Company Name": "Acme"}
+
+        assert LinkedInSync._first(data, ("company", "CompanyName", "Company Name")) == "Acme"
+        assert LinkedInSync._first(data, ("missing",)) == ""
+
+    def test_extract_experience_csv_column_names(self, mock_config):
+        """Test experience extraction from folder-export CSV column names."""
+        sync = LinkedInSync(mock_config)
+        data = {
+            "positions": [
+                {
+                    "Company Name": "Acme",
+                    "Title": "Engineer",
+                    "Started On": "Mar 2021",
+                    "Finished On": "",
+                    "Location": "Remote",
+                }
+            ]
+        }
+
+        experience = sync._extract_experience(data)
+
+        assert experience[0]["company"] == "Acme"
+        assert experience[0]["start_date"] == "2021-03"
+        assert experience[0]["end_date"] == "Present"
+        assert experience[0]["location"] == "Remote"
+
+    def test_extract_education_sorted_most_recent_first(self, mock_config):
+        """Test education is ordered by graduation date with undated entries last."""
+        sync = LinkedInSync(mock_config)
+        data = {
+            "education": [
+                {"school": "Undated College"},
+                {"school": "Old School", "endDate": "2010-05"},
+                {"school": "New School", "endDate": "2018-05"},
+            ]
+        }
+
+        education = sync._extract_education(data)
+
+        assert [e["institution"] for e in education] == [
+            "New School",
+            "Old School",
+            "Undated College",
+        ]
+
     def test_parse_linkedin_date(self, mock_config):
         """Test date parsing."""
         sync = LinkedInSync(mock_config)
@@ -240,6 +324,28 @@ class TestLinkedInSync:
         assert sync._parse_linkedin_date(None) is None
         assert sync._parse_linkedin_date("") is None
 
+    def test_parse_linkedin_date_fallbacks(self, mock_config):
+        """Test that unparseable dates fall back to the year or None."""
+        sync = LinkedInSync(mock_config)
+
+        assert sync._parse_linkedin_date("Spring 2019") == "2019-01"
+        assert sync._parse_linkedin_date("13/2020") == "2020-01"
+        assert sync._parse_linkedin_date("2020-13") == "2020-01"
+        assert sync._parse_linkedin_date("2021-02-29") == "2021-01"
+        assert sync._parse_linkedin_date("sometime") is None
+        # Repeated lookups are served from the cache with the same result
+        assert sync._parse_linkedin_date("Jan 2020") == sync._parse_linkedin_date("Jan 2020")
+
+    def test_extract_skills_deduplicates(self, mock_config):
+        """Test that repeated skills are kept once, in first-seen spelling."""
+        sync = LinkedInSync(mock_config)
+
+        skills = sync._extract_skills(
+            {"skills": [{"Name": "Python"}, "python", {"name": "Docker"}, "PYTHON", "Docker"]}
+        )
+
+        assert skills == {"languages": ["Python"], "tools": ["Docker"]}
+
     def test_categorize_skills(self, mock_config):
         """Test skill categorization."""
         sync = LinkedInSync(mock_config)
@@ -270,6 +376,25 @@ class TestLinkedInSync:
         assert "AWS" in categorized["cloud_platforms"]
         assert "PostgreSQL" in categorized["databases"]
 
+    def test_categorize_skills_uses_category_priority(self, mock_config):
+        """Test that the first matching category wins and matching is whole-word."""
+        sync = LinkedInSync(mock_config)
+
+        categorized = sync._categorize_skills(["AWS with PYTHON", "Golang", "SQL Server"])
+
+        assert categorized["languages"] == ["AWS with PYTHON", "SQL Server"]
+        assert categorized["other"] == ["Golang"]
+
+    def test_keyword_trie_pattern_matches_exact_keywords(self):
+        """Test that the trie-shaped alternation matches only the given keywords."""
+        keywords = ["java", "javascript", "c++", "go", "google cloud"]
+        pattern = re.compile(_keyword_trie_pattern(keywords))
+
+        for keyword in keywords:
+            assert pattern.fullmatch(keyword)
+        for text in ["jav", "javas", "c+", "goo", "google"]:
+            assert not pattern.fullmatch(text)
+
     def test_parse_description_to_bullets(self, mock_config):
         """Test parsing description to bullets."""
         sync = LinkedInSync(mock_config)
@@ -282,6 +407,15 @@ class TestLinkedInSync:
         assert bullets[1]["text"] == "Reduced API latency"
         assert bullets[2]["text"] == "Led engineering team"
 
+    def test_parse_description_to_bullets_plain_lines(self, mock_config):
+        """Test parsing newline-separated descriptions without bullet characters."""
+        sync = LinkedInSync(mock_config)
+
+        description = "Built microservices\r\n\n   \n  Reduced API latency  \nShort"
+        bullets = sync._parse_description_to_bullets(description)
+
+        assert [b["text"] for b in bullets] == ["Built microservices", "Reduced API latency"]
+
     def test_full_import_workflow(self, mock_config, sample_linkedin_data):
         """Test full import workflow from JSON to resume data."""
         sync = LinkedInSync(mock_config)
@@ -314,6 +448,40 @@ class TestLinkedInSync:
         finally:
             temp_path.unlink()
 
+    def test_import_json_ignores_unused_top_level_keys(self, mock_config, tmp_path):
+        """Test that streamed exports drop unrelated sections while top-level fields load."""
+        sync = LinkedInSync(mock_config)
+        export = {
+            "firstName": "Jane",
+            "lastName": "Roe",
+            "messages": [{"body": "x" * 1000} for _ in range(50)],
+            "skills": [{"name": "Python"}],
+        }
+        json_path = tmp_path / "export.json"
+        json_path.write_text(json.dumps(export))
+
+        # Stream regardless of size
+        with patch("cli.integrations.linkedin._STREAM_JSON_MIN_BYTES", 0):
+            loaded = sync._load_json_export(json_path)
+            resume_data = sync.import_from_json(json_path, use_cache=False)
+
+        assert "skills" in loaded
+        assert "firstName" in loaded
+        if ijson_available:
+            assert "messages" not in loaded
+        assert resume_data["contact"]["name"] == "Jane Roe"
+        assert resume_data["skills"]["languages"] == ["Python"]
+
+    def test_load_json_export_accepts_non_finite_numbers(self, mock_config, tmp_path):
+        """Test that exports stdlib json accepts still load with the fast parser."""
+        sync = LinkedInSync(mock_config)
+        json_path = tmp_path / "export.json"
+        json_path.write_text('{"firstName": "Jane", "score": NaN}')
+
+        loaded = sync._load_json_export(json_path)
+
+        assert loaded["firstName"] == "Jane"
+
     def test_format_date_range(self, mock_config):
         """Test date range formatting for LinkedIn export."""
         sync = LinkedInSync(mock_config)
@@ -351,6 +519,88 @@ John,Doe,,,Jan 1,"Software Engineer at Tech Corp","Experienced software engineer
         finally:
             temp_path.unlink()
 
+    def test_read_csv_file_strips_and_pads_rows(self, mock_config, tmp_path):
+        """Test CSV rows are stripped and short rows get empty trailing columns."""
+        sync = LinkedInSync(mock_config)
+        csv_path = tmp_path / "Skills.csv"
+        csv_path.write_text("Name,Endorsements\n  Python  ,12\n\nDocker\n")
+
+        rows = sync._read_csv_file(csv_path, "Skills.csv")
+
+        assert rows == [
+            {"Name": "Python", "Endorsements": "12"},
+            {"Name": "Docker", "Endorsements": ""},
+        ]
+
+    def test_read_csv_file_keeps_only_requested_fields(self, mock_config, tmp_path):
+        """Test that only requested columns are copied from each row."""
+        sync = LinkedInSync(mock_config)
+        csv_path = tmp_path / "Skills.csv"
+        csv_path.write_text("Name,Endorsements\nPython,12\n")
+
+        rows = sync._read_csv_file(csv_path, "Skills.csv", {"Name", "Missing"})
+
+        assert rows == [{"Name": "Python"}]
+
+    def test_import_from_folder(self, mock_config, tmp_path):
+        """Test importing a folder-based LinkedIn data export."""
+        sync = LinkedInSync(mock_config)
+        (tmp_path / "Profile.csv").write_text(
+            "First Name,Last Name,Headline,Geo Location\nJane,Roe,Data Engineer,Berlin\n"
+        )
+        (tmp_path / "Positions.csv").write_text(
+            "Company Name,Title,Description,Location,Started On,Finished On\n"
+            "Acme,Engineer,Built data pipelines for analytics,Berlin,Jan 2020,\n"
+        )
+        (tmp_path / "Skills.csv").write_text("Name\nPython\nTerraform\n")
+
+        resume_data = sync.import_from_json(tmp_path)
+
+        assert resume_data["contact"]["name"] == "Jane Roe"
+        assert resume_data["contact"]["location"] == {"full": "Berlin"}
+        assert resume_data["experience"][0]["company"] == "Acme"
+        assert resume_data["experience"][0]["start_date"] == "2020-01"
+        assert resume_data["skills"] == {"languages": ["Python"], "tools": ["Terraform"]}
+
+    def test_import_from_folder_profile_summary(self, mock_config, tmp_path):
+        """Test that Profile Summary.csv supplies the professional summary."""
+        sync = LinkedInSync(mock_config)
+        (tmp_path / "Profile.csv").write_text(
+            "First Name,Last Name,Headline\nJane,Roe,Data Engineer\n"
+        )
+        (tmp_path / "Profile Summary.csv").write_text("Summary\nBuilds reliable data platforms\n")
+
+        resume_data = sync.import_from_json(tmp_path)
+
+        assert resume_data["contact"]["name"] == "Jane Roe"
+        assert resume_data["professional_summary"]["base"] == "Builds reliable data platforms"
+
+    def test_import_exports_with_utf8_bom(self, mock_config, sample_linkedin_data, tmp_path):
+        """Test that a leading UTF-8 BOM does not hide the first column or key."""
+        sync = LinkedInSync(mock_config)
+        folder = tmp_path / "export"
+        folder.mkdir()
+        (folder / "Profile.csv").write_bytes(
+            "\ufeffFirst Name,Last Name\nJane,Roe\n".encode("utf-8")
+        )
+        json_path = tmp_path / "export.json"
+        json_path.write_bytes(("\ufeff" + json.dumps(sample_linkedin_data)).encode("utf-8"))
+
+        folder_data = sync.import_from_json(folder, use_cache=False)
+        json_data = sync.import_from_json(json_path, use_cache=False)
+
+        assert folder_data["contact"]["name"] == "Jane Roe"
+        assert json_data["contact"]["name"] == "John Doe"
+
+    def test_import_from_csv_header_only_is_empty(self, mock_config, tmp_path):
+        """Test that a CSV with only a header row is rejected as empty."""
+        sync = LinkedInSync(mock_config)
+        csv_path = tmp_path / "Profile.csv"
+        csv_path.write_text("First Name,Last Name\n")
+
+        with pytest.raises(ValueError, match="CSV file is empty"):
+            sync.import_from_json(csv_path)
+
     def test_import_csv_with_invalid_json_provides_helpful_error(self, mock_config):
         """Test that invalid JSON files give helpful error message about CSV."""
         sync = LinkedInSync(mock_config)
@@ -370,6 +620,98 @@ John,Doe,,,Jan 1,"Software Engineer at Tech Corp","Experienced software engineer
         finally:
             temp_path.unlink()
 
+    def test_import_from_json_uses_cache(self, mock_config, sample_linkedin_data, tmp_path):
+        """Test that unchanged exports are served from the import cache."""
+        export_path = tmp_path / "export.json"
+        export_path.write_text(json.dumps(sample_linkedin_data))
+        sync = LinkedInSync(mock_config, cache_dir=tmp_path / "cache")
+
+        first = sync.import_from_json(export_path, use_cache=True)
+        with patch.object(sync, "_import_export") as mock_import:
+            second = sync.import_from_json(export_path, use_cache=True)
+
+        mock_import.assert_not_called()
+        assert second == first
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    def test_import_cache_invalidated_when_export_changes(self, mock_config, tmp_path):
+        """Test that modifying a folder export bypasses the cached result."""
+        (tmp_path / "export").mkdir()
+        skills_csv = tmp_path / "export" / "Skills.csv"
+        skills_csv.write_text("Name\nPython\n")
+        sync = LinkedInSync(mock_config, cache_dir=tmp_path / "cache")
+
+        first = sync.import_from_json(tmp_path / "export", use_cache=True)
+        assert first["skills"] == {"languages": ["Python"]}
+
+        skills_csv.write_text("Name\nPython\nDocker\n")
+        resume_data = sync.import_from_json(tmp_path / "export", use_cache=True)
+
+        assert resume_data["skills"] == {"languages": ["Python"], "tools": ["Docker"]}
+        # The stale entry for the same export is evicted
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    def test_import_from_json_without_cache(self, mock_config, sample_linkedin_data, tmp_path):
+        """Test that use_cache=False neither reads nor writes the cache."""
+        export_path = tmp_path / "export.json"
+        export_path.write_text(json.dumps(sample_linkedin_data))
+        sync = LinkedInSync(mock_config, cache_dir=tmp_path / "cache")
+
+        resume_data = sync.import_from_json(export_path, use_cache=False)
+
+        assert resume_data["contact"]["name"] == "John Doe"
+        assert not (tmp_path / "cache").exists()
+
+    def test_import_cache_off_by_default(self, mock_config, sample_linkedin_data, tmp_path):
+        """Test that imports are not cached unless enabled in the config."""
+        export_path = tmp_path / "export.json"
+        export_path.write_text(json.dumps(sample_linkedin_data))
+
+        LinkedInSync(mock_config, cache_dir=tmp_path / "cache").import_from_json(export_path)
+        assert not (tmp_path / "cache").exists()
+
+        config = {"linkedin": {"cache_imports": True}}
+        LinkedInSync(config, cache_dir=tmp_path / "cache").import_from_json(export_path)
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    def test_clear_cache(self, mock_config, sample_linkedin_data, tmp_path):
+        """Test that clear_cache removes every cached import."""
+        sync = LinkedInSync(mock_config, cache_dir=tmp_path / "cache")
+        for name in ("a.json", "b.json"):
+            (tmp_path / name).write_text(json.dumps(sample_linkedin_data))
+            sync.import_from_json(tmp_path / name, use_cache=True)
+
+        assert sync.clear_cache() == 2
+        assert not list((tmp_path / "cache").iterdir())
+        assert LinkedInSync(mock_config, cache_dir=tmp_path / "missing").clear_cache() == 0
+
+    def test_export_to_linkedin_format(self, mock_config, sample_resume_data, tmp_path):
+        """Test exporting resume data to LinkedIn-friendly text."""
+        yaml_path = tmp_path / "resume.yaml"
+        yaml_path.write_text(yaml.safe_dump(sample_resume_data))
+        output_path = tmp_path / "out" / "linkedin.txt"
+        sync = LinkedInSync(mock_config)
+
+        content = sync.export_to_linkedin_format(yaml_path, output_path)
+
+        assert "Senior Software Engineer | Tech Corp" in content
+        assert "Jan 2020 - Dec 2023" in content
+        assert "• Built microservices" in content
+        assert "Languages: Python, JavaScript" in content
+        assert "Frameworks: Django, React" in content
+        assert "Field: Computer Science" in content
+        assert output_path.read_text(encoding="utf-8") == content
+
+    def test_export_to_linkedin_format_with_loaded_data(
+        self, mock_config, sample_resume_data, tmp_path
+    ):
+        """Test exporting already-loaded resume data without reading the YAML file."""
+        sync = LinkedInSync(mock_config)
+
+        content = sync.export_to_linkedin_format(tmp_path / "missing.yaml", data=sample_resume_data)
+
+        assert "Senior Software Engineer | Tech Corp" in content
+
 
 class TestLinkedInMerge:
     """Test cases for merging LinkedIn data with existing resume data."""
@@ -0,0 +1,167 @@
+"""Unit tests for OfferComparison class."""
+
+import math
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cli.integrations.offer_comparison import (
+    Offer,
+    OfferComparison,
+    UserPriorities,
+    _get_comparison,
+    add_offer,
+    add_offers,
+    compare_offers,
+)
+
+
+class TestOffer:
+    """Test Offer dataclass."""
+
+    def test_total_compensation(self):
+        """Test total compensation spreads equity over the vesting years."""
+        offer = Offer(company="A", role="Engineer", base_salary=100000, bonus=10000, equity=40000)
+
+        assert offer.total_compensation == 120000
+        assert "total_compensation" not in offer.to_dict()
+
+
+class TestCompareOffers:
+    """Test compare_offers method."""
+
+    def test_compare_offers_empty(self, temp_dir: Path):
+        """Test comparing with no offers returns an empty list."""
+        comparison = OfferComparison(temp_dir / "offers.json")
+
+        assert comparison.compare_offers() == []
+
+    def test_compare_offers_scores_and_order(self, temp_dir: Path):
+        """Test offers are scored and sorted by weighted score."""
+        comparison = OfferComparison(temp_dir / "offers.json")
+        comparison.offers = [
+            Offer(company="Small", role="Engineer", base_salary=100000, benefits_value=5000),
+            Offer(
+                company="Big",
+                role="Engineer",
+                base_salary=150000,
+                equity=200000,
+                benefits_value=10000,
+                remote=True,
+            ),
+        ]
+        comparison.priorities = UserPriorities(
+            salary_weight=25, growth_weight=25, wlb_weight=25, benefits_weight=25
+        )
+
+        scored = comparison.compare_offers()
+
+        assert [s.offer.company for s in scored] == ["Big", "Small"]
+        big, small = scored
+        assert big.compensation_score == 10
+        assert big.growth_score == 10
+        assert big.wlb_score == 8
+        assert big.benefits_score == 10
+        assert big.weighted_score == 9.5
+        assert small.growth_score == 5
+        assert small.wlb_score == 5
+        assert small.benefits_score == 5
+
+
+class TestGenerateComparisonReport:
+    """Test generate_comparison_report method."""
+
+    def test_report_without_offers(self, temp_dir: Path):
+        """Test the report explains how to add offers when there are none."""
+        comparison = OfferComparison(temp_dir / "offers.json")
+
+        assert comparison.generate_comparison_report().startswith("# No Offers to Compare")
+
+    def test_report_markdown_tables(self, temp_dir: Path):
+        """Test the report renders both tables as Markdown rows."""
+        comparison = OfferComparison(temp_dir / "offers.json")
+        comparison.offers = [
+            Offer(company="Acme", role="Engineer", base_salary=120000, bonus=10000, equity=40000),
+            Offer(company="Globex", role="Engineer", base_salary=100000),
+        ]
+
+        report = comparison.generate_comparison_report()
+
+        assert "| Company | Base Salary | Bonus | Equity (yr) | Total/yr |" in report
+        assert "| Acme | $120,000 | $10,000 | $10,000 | $140,000 |" in report
+        assert "| Company | Comp | Growth | WLB | Benefits | Weighted |" in report
+        assert "**Acme** is the top recommendation" in report
+
+
+class TestStorage:
+    """Test saving and loading the offers file."""
+
+    def test_offers_round_trip(self, temp_dir: Path):
+        """Test offers, including non-ASCII and NaN values, survive a save and load."""
+        storage_path = temp_dir / "offers.json"
+        comparison = OfferComparison(storage_path)
+        comparison.add_offer(Offer(company="Zoë Labs", role="Engineer", base_salary=150000))
+        comparison.add_offer(Offer(company="Odd", role="Engineer", bonus=float("nan")))
+
+        offers = OfferComparison(storage_path).offers
+
+        assert offers[0] == comparison.offers[0]
+        assert offers[1].company == "Odd"
+        assert math.isnan(offers[1].bonus)
+
+    def test_offers_with_null_text_use_fast_path(self, temp_dir: Path):
+        """Test text containing "null" does not force the slower json fallback."""
+        pytest.importorskip("orjson")
+        comparison = OfferComparison(temp_dir / "offers.json")
+
+        with patch("cli.integrations.offer_comparison.json.dumps") as mock_dumps:
+            comparison.add_offer(Offer(company="Nullable Inc", role="Engineer", notes="null"))
+
+        mock_dumps.assert_not_called()
+        assert OfferComparison(temp_dir / "offers.json").offers[0].company == "Nullable Inc"
+
+    def test_add_offers_bulk(self, temp_dir: Path):
+        """Test bulk-added offers are appended and saved together."""
+        storage_path = temp_dir / "offers.json"
+        comparison = OfferComparison(storage_path)
+        comparison.add_offer(Offer(company="A", role="Engineer"))
+
+        comparison.add_offers_bulk(Offer(company=c, role="Engineer") for c in ("B", "C"))
+
+        assert [o.company for o in OfferComparison(storage_path).offers] == ["A", "B", "C"]
+
+
+class TestModuleHelpers:
+    """Test the module-level offer helpers."""
+
+    def test_add_offer_reuses_loaded_comparison(self, temp_dir: Path, monkeypatch):
+        """Test repeated helper calls share one comparison and keep every offer."""
+        monkeypatch.setenv("HOME", str(temp_dir))
+
+        add_offer(company="A", role="Engineer", base_salary=100000)
+        comparison = _get_comparison()
+        add_offer(company="B", role="Engineer", base_salary=120000)
+
+        assert _get_comparison() is comparison
+        assert [s.offer.company for s in compare_offers()] == ["B", "A"]
+        assert len(OfferComparison(temp_dir / ".resume-cli" / "offers.json").offers) == 2
+
+    def test_add_offers(self, temp_dir: Path, monkeypatch):
+        """Test add_offers stores every offer and returns them."""
+        monkeypatch.setenv("HOME", str(temp_dir))
+
+        added = add_offers(iter([Offer(company="A", role="R"), Offer(company="B", role="R")]))
+
+        assert [o.company for o in added] == ["A", "B"]
+        assert [o.company for o in _get_comparison().offers] == ["A", "B"]
+
+    def test_helpers_reload_after_external_change(self, temp_dir: Path, monkeypatch):
+        """Test the shared comparison reloads when the offers file changes on disk."""
+        monkeypatch.setenv("HOME", str(temp_dir))
+        add_offer(company="A", role="Engineer")
+
+        other = OfferComparison(temp_dir / ".resume-cli" / "offers.json")
+        other.add_offer(Offer(company="Other", role="Manager"))
+
+        assert [o.company for o in _get_comparison().offers] == ["A", "Other"]
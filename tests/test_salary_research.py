@@ -0,0 +1,80 @@
+"""Unit tests for SalaryResearch class."""
+
+import json
+
+from cli.integrations.salary_research import SalaryResearch
+
+
+class TestResearch:
+    """Test research method."""
+
+    def test_research_applies_multipliers(self):
+        """Test title, location and company all shape the estimate."""
+        research = SalaryResearch()
+
+        data = research.research("Senior Backend Engineer", "San Francisco, CA", "Google", "senior")
+
+        # 135k-185k senior backend range, x1.25 location, x1.25 company
+        assert data.min_salary == 211000
+        assert data.max_salary == 289000
+        assert data.median_salary == 250000
+        assert data.source == "Market Estimates"
+
+    def test_research_defaults(self):
+        """Test unknown titles and levels fall back to a mid-level software engineer."""
+        research = SalaryResearch()
+
+        data = research.research("Chef", experience_level="unknown")
+
+        assert (data.min_salary, data.max_salary) == (90000, 140000)
+        assert data.equity_min > 0
+
+    def test_research_keeps_input_case(self):
+        """Test repeated lookups differing only in case keep each caller's strings."""
+        research = SalaryResearch()
+
+        first = research.research("Data Scientist", "Seattle", "Meta")
+        second = research.research("DATA SCIENTIST", "SEATTLE", "META")
+
+        assert (second.title, second.location, second.company) == (
+            "DATA SCIENTIST",
+            "SEATTLE",
+            "META",
+        )
+        assert second.min_salary == first.min_salary
+        assert second.max_salary == first.max_salary
+
+    def test_research_uses_subclass_tables(self):
+        """Test subclasses overriding the salary tables get their own lookups."""
+
+        class BaristaResearch(SalaryResearch):
+            BASE_SALARY_RANGES = {
+                "software engineer": {"mid": (90000, 140000)},
+                "barista": {"mid": (30000, 40000)},
+            }
+
+        research = BaristaResearch()
+
+        barista = research.research("Barista")
+        fallback = research.research("Data Scientist")
+
+        assert (barista.min_salary, barista.max_salary) == (30000, 40000)
+        assert (fallback.min_salary, fallback.max_salary) == (90000, 140000)
+
+
+class TestExportJson:
+    """Test export_json method."""
+
+    def test_export_json(self, temp_dir):
+        """Test exported JSON holds the figures and total compensation."""
+        research = SalaryResearch()
+        data = research.research("Product Manager", "Zürich", "Acme", "senior")
+        output_path = temp_dir / "salary.json"
+
+        research.export_json(data, output_path)
+
+        exported = json.loads(output_path.read_bytes())
+        assert exported["location"] == "Zürich"
+        assert exported["min_salary"] == data.min_salary
+        assert exported["total_compensation_min"] == data.total_compensation()[0]
+        assert exported["total_compensation_max"] == data.total_compensation()[1]
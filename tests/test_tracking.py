@@ -3,6 +3,8 @@
 import csv
 from pathlib import Path
 
+import pytest
+
 from cli.integrations.tracking import TrackingIntegration
 from cli.utils.config import Config
 
@@ -155,6 +157,24 @@ class TestLogApplication:
         assert entries[0]["company"] == "Company A"
         assert entries[1]["company"] == "Company B"
 
+    def test_log_rewrites_file_with_old_header(self, mock_config: Config, temp_dir: Path):
+        """Test log_application rewrites a CSV whose header doesn't match the fieldnames."""
+        csv_path = temp_dir / "old_header.csv"
+        csv_path.write_text("company,role\nOld Co,Old Role\n")
+        config = Config()
+        config.set("tracking.csv_path", str(csv_path))
+
+        tracking = TrackingIntegration(config)
+        tracking.log_application(company="New Co", role="New Role", status="applied")
+
+        with open(csv_path, newline="") as f:
+            reader = csv.DictReader(f)
+            headers = reader.fieldnames
+            entries = list(reader)
+
+        assert headers == tracking._get_fieldnames()
+        assert [e["company"] for e in entries] == ["Old Co", "New Co"]
+
 
 class TestGetStatistics:
     """Test get_statistics method."""
@@ -351,6 +371,26 @@ class TestUpdateStatus:
         entries = tracking._read_csv()
         assert entries[0]["status"] == "interview"
 
+    def test_update_status_repeated_updates(self, mock_config: Config, temp_dir: Path):
+        """Test successive updates and appends on one instance all reach the file."""
+        csv_path = temp_dir / "repeat.csv"
+        config = Config()
+        config.set("tracking.csv_path", str(csv_path))
+
+        tracking = TrackingIntegration(config)
+        tracking.log_application(company="A", role="R1", status="applied")
+        tracking.log_application(company="B", role="R2", status="applied")
+
+        assert tracking.update_status(company="B", new_status="interview")
+        tracking.log_application(company="C", role="R3", status="applied")
+        assert tracking.update_status(company="C", new_status="offer")
+        assert tracking.update_status(company="B", new_status="offer")
+
+        with open(csv_path, newline="") as f:
+            statuses = {row["company"]: row["status"] for row in csv.DictReader(f)}
+
+        assert statuses == {"A": "applied", "B": "offer", "C": "offer"}
+
 
 class TestReadWriteCSV:
     """Test _read_csv and _write_csv methods."""
@@ -377,6 +417,34 @@ class TestReadWriteCSV:
         # Just verify it works
         assert isinstance(entries, list)
 
+    def test_read_csv_sees_external_changes(self, mock_config: Config, temp_dir: Path):
+        """Test _read_csv re-reads the file after it changes on disk."""
+        csv_path = temp_dir / "external.csv"
+        config = Config()
+        config.set("tracking.csv_path", str(csv_path))
+
+        tracking = TrackingIntegration(config)
+        tracking.log_application(company="A", role="R1", status="applied")
+        assert [e["company"] for e in tracking._read_csv()] == ["A"]
+
+        with open(csv_path, "a", newline="") as f:
+            csv.writer(f).writerow(["v1", "B", "R2", "2024-01-01", "applied"])
+
+        assert [e["company"] for e in tracking._read_csv()] == ["A", "B"]
+
+    def test_read_csv_returns_copies(self, mock_config: Config, temp_dir: Path):
+        """Test mutating entries returned by _read_csv doesn't affect later reads."""
+        csv_path = temp_dir / "copies.csv"
+        config = Config()
+        config.set("tracking.csv_path", str(csv_path))
+
+        tracking = TrackingIntegration(config)
+        tracking.log_application(company="A", role="R1", status="applied")
+
+        tracking._read_csv()[0]["status"] = "offer"
+
+        assert tracking._read_csv()[0]["status"] == "applied"
+
     def test_write_csv_creates_headers(self, mock_config: Config, temp_dir: Path):
         """Test _write_csv writes headers."""
         csv_path = temp_dir / "write.csv"
@@ -414,6 +482,21 @@ class TestReadWriteCSV:
         assert len(entries) == 1
         assert entries[0]["company"] == "B"
 
+    def test_write_csv_failure_keeps_file(self, mock_config: Config, temp_dir: Path):
+        """Test a failed _write_csv leaves the existing CSV untouched."""
+        csv_path = temp_dir / "keep.csv"
+        config = Config()
+        config.set("tracking.csv_path", str(csv_path))
+
+        tracking = TrackingIntegration(config)
+        tracking.log_application(company="A", role="R1", status="applied")
+        before = csv_path.read_bytes()
+
+        with pytest.raises(ValueError):
+            tracking._write_csv([{"company": "B", "unknown_column": "x"}])
+
+        assert csv_path.read_bytes() == before
+
 
 class TestGetFieldnames:
     """Test _get_fieldnames method."""
@@ -519,6 +602,32 @@ class TestGetApplicationsTimeline:
         assert today_entry is not None
         assert today_entry["count"] >= 1
 
+    def test_timeline_counts_window_edges(self, mock_config: Config, temp_dir: Path):
+        """Test the first day of the window is counted and older or malformed dates are not."""
+        from datetime import date, timedelta
+
+        csv_path = temp_dir / "timeline.csv"
+        config = Config()
+        config.set("tracking.csv_path", str(csv_path))
+
+        tracking = TrackingIntegration(config)
+        first_day = (date.today() - timedelta(days=7)).isoformat()
+        too_old = (date.today() - timedelta(days=8)).isoformat()
+        tracking._write_csv(
+            [
+                {"company": "A", "date": first_day},
+                {"company": "B", "date": first_day},
+                {"company": "C", "date": too_old},
+                {"company": "D", "date": "not-a-date"},
+            ]
+        )
+
+        timeline = tracking.get_applications_timeline(days=7)
+
+        assert len(timeline) == 8
+        assert timeline[0] == {"date": first_day, "count": 2}
+        assert sum(entry["count"] for entry in timeline) == 2
+
 
 class TestGetVariantPerformance:
     """Test get_variant_performance method."""
@@ -617,6 +726,29 @@ class TestGetCompanyAnalytics:
         assert "Engineer" in acme["roles"]
         assert "Senior Engineer" in acme["roles"]
 
+    def test_company_analytics_dedupes_in_order(self, mock_config: Config, temp_dir: Path):
+        """Test roles and sources are deduplicated in first-seen order with the latest date."""
+        csv_path = temp_dir / "company.csv"
+        config = Config()
+        config.set("tracking.csv_path", str(csv_path))
+
+        tracking = TrackingIntegration(config)
+        tracking._write_csv(
+            [
+                {"company": "Acme", "role": "B", "source": "Referral", "date": "2024-03-01"},
+                {"company": "Acme", "role": "A", "source": "LinkedIn", "date": "2024-05-01"},
+                {"company": "Acme", "role": "B", "source": "Referral", "date": ""},
+                {"company": "Acme", "role": "A", "source": "LinkedIn", "response": "1"},
+            ]
+        )
+
+        (acme,) = tracking.get_company_analytics()
+
+        assert acme["roles"] == ["B", "A"]
+        assert acme["sources"] == ["Referral", "LinkedIn"]
+        assert acme["latest_application"] == "2024-05-01"
+        assert acme["has_response"] is True
+
 
 class TestGetResponseRateGauge:
     """Test get_response_rate_gauge method."""
@@ -663,6 +795,21 @@ class TestGetResponseRateGauge:
         assert gauge["offers"] == 2
         assert gauge["response_rate"] == 50.0  # 5 out of 10 got response
 
+    def test_gauge_uses_given_stats(self, mock_config: Config, temp_dir: Path):
+        """Test gauge derives its rates from precomputed statistics without reading the CSV."""
+        config = Config()
+        config.set("tracking.csv_path", str(temp_dir / "missing.csv"))
+
+        tracking = TrackingIntegration(config)
+        gauge = tracking.get_response_rate_gauge(
+            {"total": 4, "interview": 1, "offer": 2, "response_rate": 50.0}
+        )
+
+        assert gauge["response_rate"] == 50.0
+        assert gauge["interview_rate"] == 25.0
+        assert gauge["offer_rate"] == 50.0
+        assert gauge["total_applications"] == 4
+
 
 class TestGetSourceBreakdown:
     """Test get_source_breakdown method."""
@@ -731,3 +878,24 @@ class TestGetDashboardData:
         assert "interview_rate" in overview
         assert "offer_rate" in overview
         assert "total_applications" in overview
+
+    def test_dashboard_matches_individual_methods(self, mock_config: Config, temp_dir: Path):
+        """Test the single-pass dashboard agrees with each analytics method."""
+        csv_path = temp_dir / "dashboard.csv"
+        config = Config()
+        config.set("tracking.csv_path", str(csv_path))
+
+        tracking = TrackingIntegration(config)
+        tracking.log_application(company="A", role="R1", status="applied", variant="v1")
+        tracking.log_application(company="A", role="R2", status="offer", variant="v2")
+        tracking.log_application(company="B", role="R1", status="rejected", source="Referral")
+        tracking.update_status("B", "interview")
+
+        dashboard = tracking.get_dashboard_data()
+
+        assert dashboard["overview"] == tracking.get_response_rate_gauge()
+        assert dashboard["by_status"] == tracking.get_applications_by_status()
+        assert dashboard["timeline"] == tracking.get_applications_timeline(days=90)
+        assert dashboard["variant_performance"] == tracking.get_variant_performance()
+        assert dashboard["company_analytics"] == tracking.get_company_analytics()
+        assert dashboard["source_breakdown"] == tracking.get_source_breakdown()